@@ -11,47 +11,229 @@
 """Collection of functions that make it easier to debug the three classes of PyLTSpice_macOS separately
 """
 
+import codecs
+import concurrent.futures
+import functools
+import io
+import os
+import threading
+import weakref
+
 import PyLTSpice_macOS as LTC
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Default figure sizes of show_results
+DEFAULT_SCHEMATIC_FIGURE_SIZE = (20, 10)
+DEFAULT_GRAPH_FIGURE_SIZE = (20, 10)
+
+# Directories searched by get_raw_asc_data, in order
+_SEARCH_PATHS = ('test', '.')
+
+# Buffer for intermediate results of find_nearest
+_scratch = threading.local()
+# Number of values from which find_nearest sorts an unsorted array instead of scanning it for each value
+_SORT_THRESHOLD = 32
+# Array size from which find_nearest scans for several values in parallel threads
+_PARALLEL_MIN_SIZE = 1000000
+
 
-def find_nearest(array, max_vals, min_vals):
-    """Finds nearest value in an array
+def find_nearest(array, values):
+    """Finds the index of the nearest element in an array for one or more values.
+    Use :class:`NearestFinder` to search the same array repeatedly
 
     :param array: Array that will be searched
     :type array: list
-    :param max_vals: Maximum value to be searched
-    :type max_vals: double
-    :param min_vals: Minimum value to be searched
-    :type min_vals: double
+    :param values: Value or list of values to be searched for
+    :type values: double or list
+    :return: Index of the nearest element. An array of indices is returned if ``values`` is a list
+    :rtype: int or numpy.ndarray
+    """
+    if not (isinstance(array, np.ndarray) and array.dtype == np.float64):
+        array = np.asarray(array, dtype=np.float64)
+    if np.isscalar(values):
+        # A single scan is as cheap as checking whether the array is sorted
+        scratch = _get_scratch_buffer(len(array))
+        np.subtract(array, values, out=scratch)
+        np.abs(scratch, out=scratch)
+        return int(scratch.argmin())
+    targets = np.atleast_1d(np.asarray(values, dtype=np.float64))
+    if len(array) > 1 and np.all(array[1:] >= array[:-1]):
+        # Sorted arrays like the time axis can be searched with a binary search
+        idx = _find_nearest_sorted(array, targets)
+    elif len(targets) > _SORT_THRESHOLD:
+        # Sorting once is cheaper than scanning the array for each of many targets
+        idx = NearestFinder(array).find(targets)
+    elif len(array) >= _PARALLEL_MIN_SIZE and len(targets) > 1:
+        # NumPy releases the GIL on large arrays, so the scans of several targets can run in threads
+        workers = min(len(targets), os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(lambda chunk: _scan_nearest(array, chunk), np.array_split(targets, workers))
+            idx = np.concatenate(list(chunks))
+    else:
+        idx = _scan_nearest(array, targets)
+    if np.ndim(values) == 0:
+        return int(idx[0])
+    return idx
+
+
+def _scan_nearest(array, targets):
+    """Finds the indices of the nearest elements by scanning the whole array once per target
+
+    :param array: Array that will be searched
+    :type array: numpy.ndarray
+    :param targets: Values to be searched for
+    :type targets: numpy.ndarray
+    :return: Indices of the nearest elements
+    :rtype: numpy.ndarray
     """
-    array = np.asarray(array)
-    difference = np.abs(np.array(max_vals) - np.array(np.abs(min_vals)))
-    idx = np.abs(difference).argmin()
-    # print(idx)
-    # return array[idx]
+    # Unlike the junction search in PyLTSpice_macOS, there is no numba compiled variant: subtract, abs and argmin are
+    # vectorised by NumPy and a compiled loop over the array was measured to be about three times slower
+    idx = np.empty(len(targets), dtype=np.intp)
+    # Reuse the same buffer for the differences
+    scratch = _get_scratch_buffer(len(array))
+    for i, target in enumerate(targets):
+        np.subtract(array, target, out=scratch)
+        np.abs(scratch, out=scratch)
+        idx[i] = scratch.argmin()
     return idx
 
 
+def _get_scratch_buffer(size):
+    """Returns a buffer for intermediate results. The buffer is kept per thread and reused by subsequent calls
+
+    :param size: Number of elements
+    :type size: int
+    :return: buffer
+    :rtype: numpy.ndarray
+    """
+    buffer = getattr(_scratch, 'buffer', None)
+    if buffer is None or len(buffer) < size:
+        buffer = np.empty(size, dtype=np.float64)
+        _scratch.buffer = buffer
+    return buffer[:size]
+
+
+def _find_nearest_sorted(array, targets, order=None):
+    """Finds the indices of the nearest elements in a sorted array with a binary search
+
+    :param array: Sorted array that will be searched
+    :type array: numpy.ndarray
+    :param targets: Values to be searched for
+    :type targets: numpy.ndarray
+    :param order: Indices that sort the original array, as returned by ``numpy.argsort``. Default: None, the
+        array itself is the original array
+    :type order: numpy.ndarray, optional
+    :return: Indices of the nearest elements
+    :rtype: numpy.ndarray
+    """
+    right = np.clip(np.searchsorted(array, targets, side='left'), 0, len(array) - 1)
+    left = np.clip(right - 1, 0, len(array) - 1)
+    distance_left = np.abs(targets - array[left])
+    distance_right = np.abs(array[right] - targets)
+    # Report the first occurrence of repeated values
+    left = np.searchsorted(array, array[left], side='left')
+    right = np.searchsorted(array, array[right], side='left')
+    if order is not None:
+        left = order[left]
+        right = order[right]
+    # On ties the element that comes first in the original array wins
+    use_left = (distance_left < distance_right) | ((distance_left == distance_right) & (left <= right))
+    return np.where(use_left, left, right)
+
+
+class NearestFinder:
+    """Class for repeated nearest value searches in the same array. The array is sorted once, afterwards each
+    search is a binary search
+
+    :param array: Array that will be searched
+    :type array: list
+    """
+
+    def __init__(self, array):
+        """Constructor method"""
+        array = np.asarray(array, dtype=np.float64)
+        # A stable sort keeps repeated values in their original order
+        self.order = np.argsort(array, kind='stable')
+        self.sorted_array = array[self.order]
+
+    def find(self, values):
+        """Finds the index of the nearest element in the original array for one or more values
+
+        :param values: Value or list of values to be searched for
+        :type values: double or list
+        :return: Index of the nearest element. An array of indices is returned if ``values`` is a list
+        :rtype: int or numpy.ndarray
+        """
+        targets = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        idx = _find_nearest_sorted(self.sorted_array, targets, self.order)
+        if np.ndim(values) == 0:
+            return int(idx[0])
+        return idx
+
+
 def get_raw_asc_data(filename, encoding='utf-16-le'):
-    """Reads in a raw asc file. Helpful for debugging the Schematic class
+    """Reads in a raw asc file. Helpful for debugging the Schematic class.
+    Files are cached until they are modified, the cache can be emptied with ``get_raw_asc_data.cache_clear()``
 
     :param filename: Absolute path to filename
     :type filename: str
-    :param encoding: Encoding. Default is ``utf-16-le`` if this fails try ``latin9``
+    :param encoding: Encoding. Default is ``utf-16-le`` if this fails try ``latin9``. With None the encoding is
+        detected from the content of the file
     :type encoding: str, optional
     :return: data
     :rtype: str list
     """
-    try:
-        fid = open('test/' + filename, 'r', encoding=encoding)
-    except FileNotFoundError:
-        fid = open(filename, 'r', encoding=encoding)
-    data = fid.readlines()
-    fid.close()
+    for directory in _SEARCH_PATHS:
+        path = os.path.join(directory, filename)
+        if os.path.isfile(path):
+            break
+    else:
+        raise FileNotFoundError(filename)
+    stat = os.stat(path)
+    # Return a copy, callers are allowed to edit the lines
+    return list(_read_asc_file(path, encoding, stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _read_asc_file(path, encoding, mtime, size):
+    """Reads the lines of an asc file. Modification time and size are only part of the cache key
+
+    :param path: Path to the file
+    :type path: str
+    :param encoding: Encoding of the file, None to detect it
+    :type encoding: str
+    :param mtime: Modification time of the file in ns
+    :type mtime: int
+    :param size: Size of the file in bytes
+    :type size: int
+    :return: data
+    :rtype: str tuple
+    """
+    with open(path, 'rb') as fid:
+        raw = fid.read()
+    if encoding is None:
+        encoding = _detect_asc_encoding(raw)
+    # A byte order mark stays at the start of the first line, so write_asc_file writes it back
+    # Decode the whole file at once, StringIO takes care of the newline translation
+    return tuple(io.StringIO(raw.decode(encoding), newline=None).readlines())
+
+
+get_raw_asc_data.cache_clear = _read_asc_file.cache_clear
+
 
-    return data
+def _detect_asc_encoding(raw):
+    """Detects the encoding of the content of an asc file. LTSpice writes ``utf-16-le``, older versions ``latin9``
+
+    :param raw: Content of the file
+    :type raw: bytes
+    :return: encoding
+    :rtype: str
+    """
+    # Every file starts with 'Version', in UTF-16 LE every second byte of it is zero
+    if raw.startswith(codecs.BOM_UTF16_LE) or raw[1:2] == b'\x00':
+        return 'utf-16-le'
+    return 'ISO-8859-1'
 
 
 def write_asc_file(filename, data):
@@ -63,14 +245,145 @@ def write_asc_file(filename, data):
     :type data: str list
     :return: void
     """
-    fid = open('test/' + filename, 'w', encoding='utf-16-le')
-    fid.writelines(data)
-    fid.close()
+    # Encode everything at once and hand it to the OS without Python's buffered file objects
+    buffer = memoryview(''.join(data).encode('utf-16-le'))
+    fd = os.open('test/' + filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        while buffer:
+            buffer = buffer[os.write(fd, buffer):]
+    finally:
+        os.close(fd)
+
+
+# Figures of show_results with their lines, reused by consecutive calls with the same layout
+_results_figures = {}
+# Number of show_results calls per LTC object, needed to skip plots
+_show_results_calls = weakref.WeakKeyDictionary()
+
+
+def _plot_results(figure_size, subplot, traces):
+    """Plots the input and output trace of show_results. If a figure with the same layout is still open, only the
+    data of its lines is replaced and the lines are blitted onto the stored background
+
+    :param figure_size: Size of the figure
+    :type figure_size: Tuple
+    :param subplot: Boolean whether the traces are plotted in separate subplots
+    :type subplot: Bool
+    :param traces: x and y values of the input and the output trace
+    :type traces: list
+    :return: void
+    """
+    key = (tuple(figure_size), bool(subplot))
+    cached = _results_figures.get(key)
+    # The figure might have been closed by the user in the meantime
+    if cached is None or not plt.fignum_exists(cached['figure'].number):
+        _results_figures[key] = _create_results_figure(figure_size, subplot, traces)
+        return
+
+    for line, (x_values, y_values) in zip(cached['lines'], traces):
+        line.set_data(x_values, y_values)
+    axes = cached['axes']
+    limits = [ax.viewLim.get_points().copy() for ax in axes]
+    for ax in axes:
+        ax.relim()
+        ax.autoscale_view()
+    limits_unchanged = all(np.array_equal(limit, ax.viewLim.get_points()) for limit, ax in zip(limits, axes))
+
+    canvas = cached['figure'].canvas
+    if cached['background'] is None or not limits_unchanged or not canvas.supports_blit:
+        _draw_results_background(cached)
+    else:
+        for background in cached['background']:
+            canvas.restore_region(background)
+    for line in cached['lines']:
+        line.axes.draw_artist(line)
+    for ax in axes:
+        canvas.blit(ax.bbox)
+
+
+def _create_results_figure(figure_size, subplot, traces):
+    """Creates the figure of show_results
+
+    :param figure_size: Size of the figure
+    :type figure_size: Tuple
+    :param subplot: Boolean whether the traces are plotted in separate subplots
+    :type subplot: Bool
+    :param traces: x and y values of the input and the output trace
+    :type traces: list
+    :return: Figure, axes, lines and the background for blitting, which is stored with the next update
+    :rtype: dict
+    """
+    fig = plt.figure(figsize=figure_size)
+    if subplot:
+        axes = [fig.add_subplot(2, 1, 1), fig.add_subplot(2, 1, 2)]
+    else:
+        ax = fig.add_subplot(1, 1, 1)
+        axes = [ax, ax]
+    # The traces are rasterized, dense traces would otherwise be drawn segment by segment in vector outputs
+    lines = [ax.plot(x_values, y_values, label=label, rasterized=True)[0]
+             for ax, (x_values, y_values), label in zip(axes, traces, ('Input', 'Output'))]
+    axes = list(dict.fromkeys(axes))
+    for ax in axes:
+        ax.legend()
+        ax.grid(True, which='both')
+    fig.canvas.draw_idle()
+
+    cached = {'figure': fig, 'axes': axes, 'lines': lines, 'background': None}
+    # Every full redraw, e.g. after resizing the window, invalidates the stored background
+    fig.canvas.mpl_connect('draw_event', lambda event: cached.update(background=None))
+    return cached
+
+
+def _draw_results_background(cached):
+    """Draws the figure of show_results without its lines and stores the background for blitting
+
+    :param cached: Figure, axes, lines and background as created by :func:`_create_results_figure`
+    :type cached: dict
+    :return: void
+    """
+    canvas = cached['figure'].canvas
+    for line in cached['lines']:
+        line.set_visible(False)
+    canvas.draw()
+    for line in cached['lines']:
+        line.set_visible(True)
+    if canvas.supports_blit:
+        cached['background'] = [canvas.copy_from_bbox(ax.bbox) for ax in cached['axes']]
+
+
+def min_max_decimate(x_values, y_values, n_bins):
+    """Reduces a trace to the minimum and maximum value of each bin. Used to plot long traces without losing peaks
+
+    :param x_values: x values of the trace, e.g. the time axis
+    :type x_values: numpy.ndarray
+    :param y_values: y values of the trace
+    :type y_values: numpy.ndarray
+    :param n_bins: Number of bins the trace is split into
+    :type n_bins: int
+    :returns:
+        - **x_values** (numpy.ndarray) - x values of the reduced trace
+        - **y_values** (numpy.ndarray) - y values of the reduced trace
+    """
+    y_values = np.asarray(y_values)
+    bin_size = -(-len(y_values) // max(1, n_bins))
+    n_full = len(y_values) // bin_size * bin_size
+    # Full bins are evaluated at once, a shorter last bin is handled separately
+    blocks = y_values[:n_full].reshape(-1, bin_size)
+    offsets = np.arange(0, n_full, bin_size)
+    idx_min = blocks.argmin(axis=1) + offsets
+    idx_max = blocks.argmax(axis=1) + offsets
+    if n_full < len(y_values):
+        idx_min = np.append(idx_min, y_values[n_full:].argmin() + n_full)
+        idx_max = np.append(idx_max, y_values[n_full:].argmax() + n_full)
+    # Keep the original order of the minimum and maximum within each bin
+    idx = np.sort(np.stack([idx_min, idx_max], axis=1), axis=1).ravel()
+    return np.asarray(x_values)[idx], y_values[idx]
 
 
 def show_results(ltcobject, voltage_input_name, voltage_output_name,
-                 plot_schematic=True, schematic_figure_size=(20, 10),
-                 plot_graph=True, graph_figure_size=(20, 10), subplot=False):
+                 plot_schematic=True, schematic_figure_size=DEFAULT_SCHEMATIC_FIGURE_SIZE,
+                 plot_graph=True, graph_figure_size=DEFAULT_GRAPH_FIGURE_SIZE, subplot=False,
+                 max_points=None, disp_skip=1, fp32_plot=True):
     """Quick plot helper for ``.tran`` commands. Based on the assumption that the input and output of the simulation are labeled
 
     :param ltcobject: LTC object
@@ -89,32 +402,47 @@ def show_results(ltcobject, voltage_input_name, voltage_output_name,
     :type graph_figure_size: Tuple, optional
     :param subplot: Boolean whether the input and output label are plotted in separate graphs or in in graph. Default: False
     :type subplot: Bool, optional
+    :param max_points: Maximum number of points per plotted trace. Longer traces are reduced to their minimum and
+        maximum values per bin, which keeps the visible envelope. Default: Twice the figure width in pixels
+    :type max_points: int, optional
+    :param disp_skip: Only every ``disp_skip``-th call with the same LTC object actually plots, e.g. to follow a
+        parameter sweep without spending most of the time on plotting. Default: 1
+    :type disp_skip: int, optional
+    :param fp32_plot: Boolean whether the voltage traces are converted to single precision before plotting. This is
+        sufficient for the screen and halves the amount of data to be processed. The time axis keeps double
+        precision, single precision cannot tell apart the time steps of long simulations. Default: True
+    :type fp32_plot: Bool, optional
     :return: void
     """
+    # Return before any work is done if there is nothing to plot
+    plot_graph = plot_graph and ltcobject.simulate_data
+    if not (plot_schematic or plot_graph):
+        return
+    calls = _show_results_calls.get(ltcobject, 0)
+    _show_results_calls[ltcobject] = calls + 1
+    if calls % max(1, disp_skip):
+        return
     if plot_schematic:
         ltcobject.schematic.plot_schematic(figsize=schematic_figure_size)
-    if ltcobject.simulate_data:
-        if plot_graph:
-            time = ltcobject.get_trace_data(0)
-            v_in_string = 'V(' + str(voltage_input_name) + ')'
-            v_in = ltcobject.get_trace_data(v_in_string)
-            v_out_string = 'V(' + str(voltage_output_name) + ')'
-            v_out = ltcobject.get_trace_data(v_out_string)
-
-            plt.figure(figsize=graph_figure_size)
-            if subplot:
-                plt.subplot(2, 1, 1)
-                plt.plot(np.abs(time), v_in, label='Input')
-                plt.legend()
-                plt.grid(True, which='both')
-
-                plt.subplot(2, 1, 2)
-                plt.plot(np.abs(time), v_out, label='Output')
-                plt.legend()
-                plt.grid(True, which='both')
-            else:
-                plt.plot(np.abs(time), v_in, label='Input')
-                plt.plot(np.abs(time), v_out, label='Output')
-                plt.legend()
-                plt.grid(True, which='both')
-            plt.show()
+    if plot_graph:
+        time, v_in, v_out = ltcobject.get_trace_data_bulk([0, f'V({voltage_input_name})',
+                                                           f'V({voltage_output_name})'])
+        # Single precision is sufficient for the voltages on the screen, complex data is left untouched. With about
+        # 7 significant digits, the time axis of e.g. 1 s sampled at 10 ns would collapse neighbouring samples
+        if fp32_plot:
+            v_in, v_out = [trace if np.iscomplexobj(trace) else np.ascontiguousarray(trace, dtype=np.float32)
+                           for trace in (v_in, v_out)]
+        # LTSpice stores some time points with a negative sign, take the absolute value only once
+        time = np.abs(time)
+
+        # More points than pixels only slow down the drawing
+        if not max_points:
+            max_points = 2 * int(graph_figure_size[0] * plt.rcParams['figure.dpi'])
+        if len(time) > max_points:
+            time_in, v_in = min_max_decimate(time, v_in, max_points // 2)
+            time_out, v_out = min_max_decimate(time, v_out, max_points // 2)
+        else:
+            time_in = time_out = time
+
+        _plot_results(graph_figure_size, subplot, [(time_in, v_in), (time_out, v_out)])
+        plt.show()
@@ -10,11 +10,21 @@
 # ---------------------------------------------------------------------------------------------------
 """ Implementation of the default values of the project
 """
+import enum
+import functools
 import getpass
+import logging
+import os
+from sys import intern
+from types import MappingProxyType
+from typing import Final
 
+logger = logging.getLogger(__name__)
 
+
+@functools.cache
 def get_user():
-    """Function to get the current user
+    """Function to get the current user. The login name is looked up once per process
 
     :parameter: None
     :return: login name of the user.
@@ -22,8 +32,625 @@ def get_user():
     return getpass.getuser()
 
 
+@functools.cache
+def get_library_default_location():
+    """Function to get the default location of the LTSpice symbol library in the home directory of the user
+
+    :parameter: None
+    :return: path to the symbol library
+    """
+    return os.path.join(os.path.expanduser('~'), 'Library', 'Application Support', 'LTspice', 'lib', 'sym', '')
+
+
+class Anchor(enum.IntEnum):
+    """Anchors of a text as stored in the text alignment tables. Use ``ANCHOR_NAMES`` to get the name of the
+    anchor for matplotlib"""
+    CENTER = 0
+    TOP = 1
+    BOTTOM = 2
+    LEFT = 3
+    RIGHT = 4
+
+
+# Matplotlib names of the anchors, indexed by Anchor
+ANCHOR_NAMES = ('center', 'top', 'bottom', 'left', 'right')
+
+
+def _freeze(table):
+    """Function to make a nested table read-only. Strings are interned so that repeated values share one object
+
+    :parameter table: Table to be frozen
+    :type table: dict
+    :return: read-only view of the table
+    """
+    return MappingProxyType({key: intern(value) if isinstance(value, str) else
+                             _freeze(value) if isinstance(value, dict) else value
+                             for key, value in table.items()})
+
+
+def _flatten(table):
+    """Function to turn a table of the form ``{alignment: {rotation: value}}`` into ``{(alignment, rotation): value}``.
+    The keys are interned
+
+    :parameter table: Nested table
+    :type table: dict
+    :return: flat table
+    """
+    return {(intern(outer_key), intern(inner_key)): value for outer_key, inner_table in table.items()
+            for inner_key, value in inner_table.items()}
+
+
+# Hardcoded dictionary for all LTSpice parameters, built once at import
+_TOTAL_DICT = {
+    # Default location of the LTSpice App
+    'LTSPICE_APP_DEFAULT_LOC': '/Applications/LTspice.app',
+
+    # Parameters of a sinus source
+    'SOURCE_PARAMETERS_SINE': {'DC_Offset': 0,
+                               'Amplitude': 1,
+                               'Frequency': 2,
+                               'Delay': 3,
+                               'Dampfing_factor': 4,
+                               'Phase': 5,
+                               'Cycles': 6},
+
+    'SOURCE_TYPES': frozenset(('SINE',)),
+
+    'ASC_COMPONENT_NAME_START': 'InstName',
+
+    'ASC_COMPONENT_VALUE_START': 'Value',
+
+    'SPICE_DIRECTIVES': frozenset(('.tran',
+                                   '.ac',
+                                   '.dc',
+                                   '.noise',
+                                   '.tf',
+                                   '.op')),
+
+    'LTSPICE_RUN_TIME': 1,
+
+    'LTSPICE_POLL_INTERVAL': 0.1,
+
+    'DEFAULT_ALIGNMENT_MAPPER': {'LEFT': 'Left',
+                                 'CENTER': 'Center',
+                                 'RIGHT': 'Right',
+                                 'TOP': 'Top',
+                                 'BOTTOM': 'Bottom',
+                                 'VLEFT': 'VLeft',
+                                 'VCENTER': 'VCenter',
+                                 'VRIGHT': 'VRight',
+                                 'VTOP': 'VTop',
+                                 'VBOTTOM': 'VBottom'},
+
+    # Indexed by the line style number of LTSpice
+    'DEFAULT_LINE_STYLES': ('-',
+                            '--',
+                            ':',
+                            '-.',
+                            '-..'),
+
+    'DEFAULT_FIG_SIZE': (20, 10),
+
+    'DEFAULT_FONT_SIZE': 14,
+
+    # Indexed by the font size number of LTSpice
+    'LTSPICE_FONTSIZES': (0.625,
+                          1.0,
+                          1.5,
+                          2.0,
+                          2.5,
+                          3.5,
+                          5.0,
+                          7.0),
+
+    'DEFAULT_JUNCTION_SIZE': 12,
+
+    # Path simplification threshold in pixels for plot_schematic, lower it for publication quality plots
+    'PATH_SIMPLIFY_THRESHOLD': 1.0,
+
+    'PLOT_NO_OF_COORDINATES': {'WINDOW': 4,
+                               'PIN': 3,
+                               'Version': 1,
+                               'CIRCLE': 4,
+                               'LINE': 5,
+                               'RECTANGLE': 4,
+                               'ARC': 9,
+                               'TEXT': 2},
+
+    'PLOT_KEYS': ('LINE',
+                  'CIRCLE',
+                  'ARC',
+                  'RECTANGLE',
+                  'WINDOW',
+                  'TEXT',
+                  'PIN'),
+
+    'WINDOW_TYPES': {0: 'Prefix',
+                     3: 'Value',
+                     123: 'Value2',
+                     39: 'SpiceLine'}
+}
+
+# The nested tables are shared between all Defines objects and must not be changed
+_TOTAL_DICT = {key: _freeze(value) if isinstance(value, dict) else value for key, value in _TOTAL_DICT.items()}
+
+# The defaults as module level constants, e.g. ``from DefinesDefault import DEFAULT_FONT_SIZE``.
+# Use a Defines object for values that can be changed with set_define. The text tables are built on first access
+LTSPICE_APP_DEFAULT_LOC: Final = _TOTAL_DICT['LTSPICE_APP_DEFAULT_LOC']
+SOURCE_PARAMETERS_SINE: Final = _TOTAL_DICT['SOURCE_PARAMETERS_SINE']
+SOURCE_TYPES: Final = _TOTAL_DICT['SOURCE_TYPES']
+ASC_COMPONENT_NAME_START: Final = _TOTAL_DICT['ASC_COMPONENT_NAME_START']
+ASC_COMPONENT_VALUE_START: Final = _TOTAL_DICT['ASC_COMPONENT_VALUE_START']
+SPICE_DIRECTIVES: Final = _TOTAL_DICT['SPICE_DIRECTIVES']
+LTSPICE_RUN_TIME: Final = _TOTAL_DICT['LTSPICE_RUN_TIME']
+LTSPICE_POLL_INTERVAL: Final = _TOTAL_DICT['LTSPICE_POLL_INTERVAL']
+DEFAULT_ALIGNMENT_MAPPER: Final = _TOTAL_DICT['DEFAULT_ALIGNMENT_MAPPER']
+DEFAULT_LINE_STYLES: Final = _TOTAL_DICT['DEFAULT_LINE_STYLES']
+DEFAULT_FIG_SIZE: Final = _TOTAL_DICT['DEFAULT_FIG_SIZE']
+DEFAULT_FONT_SIZE: Final = _TOTAL_DICT['DEFAULT_FONT_SIZE']
+LTSPICE_FONTSIZES: Final = _TOTAL_DICT['LTSPICE_FONTSIZES']
+DEFAULT_JUNCTION_SIZE: Final = _TOTAL_DICT['DEFAULT_JUNCTION_SIZE']
+PATH_SIMPLIFY_THRESHOLD: Final = _TOTAL_DICT['PATH_SIMPLIFY_THRESHOLD']
+PLOT_NO_OF_COORDINATES: Final = _TOTAL_DICT['PLOT_NO_OF_COORDINATES']
+PLOT_KEYS: Final = _TOTAL_DICT['PLOT_KEYS']
+WINDOW_TYPES: Final = _TOTAL_DICT['WINDOW_TYPES']
+
+
+def _text_vertical_alignments():
+    """Function to get the vertical alignments of texts as ``{alignment: {rotation: value}}``"""
+    return {'Left': {'R0': 'center',
+                     'R90': 'top',
+                     'R180': 'center',
+                     'R270': 'bottom',  # ver 25.04
+
+                     'M0': 'center',
+                     'M90': 'top',
+                     'M180': 'center',
+                     'M270': 'bottom',  # ver 25.04
+
+                     'R0ML': 'top',
+                     'R90ML': 'top',
+                     'R180ML': 'center',
+                     'R270ML': 'bottom',
+
+                     'M0ML': 'top',
+                     'M90ML': 'top',
+                     'M180ML': 'center',
+                     'M270ML': 'center'
+                     },
+
+            'Center': _ALL_CENTER,
+
+            'Right': {'R0': 'center',
+                      'R90': 'bottom',
+                      'R180': 'center',
+                      'R270': 'top',  # ver 25.04
+
+                      'M0': 'center',
+                      'M90': 'bottom',  # ver 25.04
+                      'M180': 'center',
+                      'M270': 'top',  # ver 25.04
+
+                      'R0ML': 'center',
+                      'R90ML': 'bottom',
+                      'R180ML': 'center',
+                      'R270ML': 'top',
+
+                      'M0ML': 'center',
+                      'M90ML': 'bottom',
+                      'M180ML': 'center',
+                      'M270ML': 'top'
+                      },
+
+            'Top': {'R0': 'top',
+                    'R90': 'center',  # ver 25.04
+                    'R180': 'bottom',  # ver 25.04
+                    'R270': 'center',  # ver 25.04
+
+                    'M0': 'top',  # ver 25.04
+                    'M90': 'center',  # ver 25.04
+                    'M180': 'bottom',  # ver 25.04
+                    'M270': 'center',
+
+                    'R0ML': 'top',
+                    'R90ML': 'top',
+                    'R180ML': 'center',
+                    'R270ML': 'bottom',
+
+                    'M0ML': 'center',
+                    'M90ML': 'top',
+                    'M180ML': 'center',
+                    'M270ML': 'bottom'
+                    },
+
+            'Bottom': {'R0': 'bottom',
+                       'R90': 'bottom',
+                       'R180': 'top',
+                       'R270': 'center',  # ver 25.04
+
+                       'M0': 'bottom',  # ver 25.04
+                       'M90': 'center',
+                       'M180': 'top',  # ver 25.04
+                       'M270': 'center',  # ver 25.04
+
+                       'R0ML': 'bottom',
+                       'R90ML': 'bottom',
+                       'R180ML': 'center',
+                       'R270ML': 'top',
+
+                       'M0ML': 'center',
+                       'M90ML': 'bottom',
+                       'M180ML': 'center',
+                       'M270ML': 'top'
+                       },
+
+            'VLeft': {'R0': 'bottom',
+                      'R90': 'top',
+                      'R180': 'center',
+                      'R270': 'center',
+
+                      'M0': 'center',
+                      'M90': 'top',
+                      'M180': 'bottom',
+                      'M270': 'center',
+
+                      'R0ML': 'bottom',
+                      'R90ML': 'top',
+                      'R180ML': 'center',
+                      'R270ML': 'center',
+
+                      'M0ML': 'center',
+                      'M90ML': 'top',
+                      'M180ML': 'bottom',
+                      'M270ML': 'center'
+                      },
+
+            'VCenter': _ALL_CENTER,
+
+            'VRight': {'R0': 'top',
+                       'R90': 'center',
+                       'R180': 'bottom',
+                       'R270': 'center',
+
+                       'M0': 'top',
+                       'M90': 'center',
+                       'M180': 'bottom',
+                       'M270': 'center',
+
+                       'R0ML': 'top',
+                       'R90ML': 'center',
+                       'R180ML': 'bottom',
+                       'R270ML': 'center',
+
+                       'M0ML': 'top',
+                       'M90ML': 'center',
+                       'M180ML': 'bottom',
+                       'M270ML': 'center'
+                       },
+
+            'VTop': {'R0': 'center',
+                     'R90': 'top',
+                     'R180': 'center',
+                     'R270': 'bottom',
+
+                     'M0': 'center',
+                     'M90': 'top',
+                     'M180': 'center',
+                     'M270': 'bottom',
+
+                     'R0ML': 'center',
+                     'R90ML': 'top',
+                     'R180ML': 'center',
+                     'R270ML': 'bottom',
+
+                     'M0ML': 'center',
+                     'M90ML': 'top',
+                     'M180ML': 'center',
+                     'M270ML': 'bottom'
+                     },
+
+            'VBottom': {'R0': 'center',
+                        'R90': 'bottom',
+                        'R180': 'center',
+                        'R270': 'top',
+
+                        'M0': 'center',
+                        'M90': 'bottom',
+                        'M180': 'center',
+                        'M270': 'top',
+
+                        'R0ML': 'center',
+                        'R90ML': 'bottom',
+                        'R180ML': 'center',
+                        'R270ML': 'top',
+
+                        'M0ML': 'center',
+                        'M90ML': 'bottom',
+                        'M180ML': 'center',
+                        'M270ML': 'top'
+                        }
+            }
+
+
+def _text_horizontal_alignments():
+    """Function to get the horizontal alignments of texts as ``{alignment: {rotation: value}}``"""
+    return {'Left': {'R0': 'left',
+                     'R90': 'center',
+                     'R180': 'right',
+                     'R270': 'center',  # ver 25.04
+
+                     'M0': 'right',  # ver 25.04
+                     'M90': 'center',
+                     'M180': 'left',  # ver 25.04
+                     'M270': 'center',  # ver 25.04
+
+                     'R0ML': 'left',
+                     'R90ML': 'center',
+                     'R180ML': 'right',
+                     'R270ML': 'left',
+
+                     'M0ML': 'right',
+                     'M90ML': 'center',
+                     'M180ML': 'left',
+                     'M270ML': 'left'
+                     },
+
+            'Center': _ALL_CENTER,
+
+            'Right': {'R0': 'right',
+                      'R90': 'center',
+                      'R180': 'left',
+                      'R270': 'center',  # ver 25.04
+
+                      'M0': 'left',  # ver 25.04
+                      'M90': 'center',  # ver 25.04
+                      'M180': 'right',
+                      'M270': 'center',  # ver 25.04
+
+                      'R0ML': 'right',
+                      'R90ML': 'right',
+                      'R180ML': 'right',
+                      'R270ML': 'right',
+
+                      'M0ML': 'right',
+                      'M90ML': 'right',
+                      'M180ML': 'right',
+                      'M270ML': 'right'
+                      },
+
+            'Top': {'R0': 'center',
+                    'R90': 'right',  # ver 25.04
+                    'R180': 'center',
+                    'R270': 'left',  # ver 25.04
+
+                    'M0': 'center',
+                    'M90': 'left',  # ver 25.04
+                    'M180': 'center',
+                    'M270': 'right',
+
+                    'R0ML': 'center',
+                    'R90ML': 'center',
+                    'R180ML': 'center',
+                    'R270ML': 'center',
+
+                    'M0ML': 'center',
+                    'M90ML': 'center',
+                    'M180ML': 'center',
+                    'M270ML': 'center'
+                    },
+
+            'Bottom': {'R0': 'center',
+                       'R90': 'left',
+                       'R180': 'center',
+                       'R270': 'right',
+
+                       'M0': 'center',
+                       'M90': 'right',  # ver 25.04
+                       'M180': 'center',
+                       'M270': 'left',
+
+                       'R0ML': 'center',
+                       'R90ML': 'center',
+                       'R180ML': 'center',
+                       'R270ML': 'center',
+
+                       'M0ML': 'center',
+                       'M90ML': 'center',
+                       'M180ML': 'center',
+                       'M270ML': 'center'
+                       },
+
+            'VLeft': {'R0': 'center',
+                      'R90': 'center',
+                      'R180': 'right',
+                      'R270': 'right',  # ver 01.05
+
+                      'M0': 'right',
+                      'M90': 'center',
+                      'M180': 'left',
+                      'M270': 'left',
+
+                      'R0ML': 'center',
+                      'R90ML': 'center',
+                      'R180ML': 'right',
+                      'R270ML': 'left',
+
+                      'M0ML': 'right',
+                      'M90ML': 'center',
+                      'M180ML': 'left',
+                      'M270ML': 'left'
+                      },
+
+            'VCenter': _ALL_CENTER,
+
+            'VRight': {'R0': 'center',
+                       'R90': 'right',
+                       'R180': 'center',
+                       'R270': 'left',
+
+                       'M0': 'center',
+                       'M90': 'left',  # ver 01.05
+                       'M180': 'center',
+                       'M270': 'left',
+
+                       'R0ML': 'center',
+                       'R90ML': 'left',
+                       'R180ML': 'center',
+                       'R270ML': 'left',
+
+                       'M0ML': 'center',
+                       'M90ML': 'left',
+                       'M180ML': 'center',
+                       'M270ML': 'left'
+                       },
+
+            'VTop': {'R0': 'left',
+                     'R90': 'center',
+                     'R180': 'right',
+                     'R270': 'center',
+
+                     'M0': 'right',
+                     'M90': 'center',
+                     'M180': 'left',
+                     'M270': 'center',
+
+                     'R0ML': 'left',
+                     'R90ML': 'center',
+                     'R180ML': 'right',
+                     'R270ML': 'center',
+
+                     'M0ML': 'right',
+                     'M90ML': 'center',
+                     'M180ML': 'left',
+                     'M270ML': 'center'
+                     },
+
+            'VBottom': {'R0': 'right',
+                        'R90': 'center',
+                        'R180': 'left',
+                        'R270': 'center',
+
+                        'M0': 'left',  # ver 25.04
+                        'M90': 'center',
+                        'M180': 'right',  # ver 25.04
+                        'M270': 'center',
+
+                        'R0ML': 'left',
+                        'R90ML': 'center',
+                        'R180ML': 'right',
+                        'R270ML': 'center',
+
+                        'M0ML': 'right',
+                        'M90ML': 'center',
+                        'M180ML': 'left',
+                        'M270ML': 'center'
+                        }
+            }
+
+
+@functools.cache
+def _rotation_quarter_turns():
+    """Function to get the rotation of the texts in quarter turns, built on first use. One row per alignment and one
+    column per rotation, both in the order of _ALIGNMENT_ROWS and _ROTATION_COLUMNS
+
+    :parameter: None
+    :return: rotations as bytes
+    """
+    # Columns: R0 R90 R180 R270 M0 M90 M180 M270 R0ML R90ML R180ML R270ML M0ML M90ML M180ML M270ML
+    return bytes((
+        0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 1,  # Left
+        0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,  # Center, R90 checked with ver 25.04
+        0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,  # Right, R90 M270 checked with ver 25.04
+        0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0,  # Top, R90 M90 checked with ver 25.04
+        0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,  # Bottom, M90 M270 checked with ver 25.04
+        1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,  # VLeft
+        1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,  # VCenter
+        1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 1, 0, 0, 0,  # VRight
+        1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0,  # VTop, R0 R180 M0 M180 checked with ver 25.04
+        1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0,  # VBottom, R0 R180 M0 M180 checked with ver 25.04
+    ))
+
+
+def _text_rotation_angles():
+    """Function to get the rotation angles of texts as ``{alignment: {rotation: value}}``"""
+    return {alignment: {rotation: get_rotation_angle(alignment, rotation) for rotation in _ROTATION_COLUMNS}
+            for alignment in _ALIGNMENT_ROWS}
+
+
+# Builders of the text tables, which are only built when they are used
+_TEXT_TABLES = MappingProxyType({'TEXT_VERTICAL_ALIGNMENTS': _text_vertical_alignments,
+                                 'TEXT_HORIZONTAL_ALIGNMENTS': _text_horizontal_alignments,
+                                 'TEXT_ROTATION_ANGLES': _text_rotation_angles})
+
+
+@functools.cache
+def _build_text_table(key):
+    """Function to build a text table on first use. The table is looked up with a single (alignment, rotation) key
+    and the alignments are stored as anchors, which are only converted to strings when the text is plotted
+
+    :parameter key: Name of the text table
+    :type key: str
+    :return: read-only text table
+    """
+    table = _flatten(_TEXT_TABLES[key]())
+    if key != 'TEXT_ROTATION_ANGLES':
+        table = {position: Anchor[value.upper()] for position, value in table.items()}
+    return _freeze(table)
+
+
+def __getattr__(name):
+    """Builds the text tables when they are first accessed as module attributes
+
+    :parameter name: Name of the attribute
+    :type name: str
+    :return: the text table
+    """
+    if name in _TEXT_TABLES:
+        table = globals()[name] = _build_text_table(name)
+        return table
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+# Rows and columns of the rotation table by the names of the alignments and rotations as used in the asc and asy
+# files. Rotations of multi line texts have the suffix ``ML``
+_ALIGNMENT_ROWS = MappingProxyType({alignment: row for row, alignment in enumerate((
+    'Left', 'Center', 'Right', 'Top', 'Bottom', 'VLeft', 'VCenter', 'VRight', 'VTop', 'VBottom'))})
+_ROTATION_COLUMNS = MappingProxyType({rotation: column for column, rotation in enumerate((
+    'R0', 'R90', 'R180', 'R270', 'M0', 'M90', 'M180', 'M270',
+    'R0ML', 'R90ML', 'R180ML', 'R270ML', 'M0ML', 'M90ML', 'M180ML', 'M270ML'))})
+
+# Alignment of the texts that are centered for every rotation
+_ALL_CENTER = MappingProxyType(dict.fromkeys(_ROTATION_COLUMNS, 'center'))
+
+
+@functools.cache
+def get_rotation_angle(alignment, rotation):
+    """Function to get the default rotation angle of a text. Results are cached, there are only 160 valid
+    combinations
+
+    :parameter alignment: Alignment of the text
+    :type alignment: str
+    :parameter rotation: Rotation of the symbol
+    :type rotation: str
+    :return: rotation angle in degrees
+    """
+    return 90 * _rotation_quarter_turns()[_ALIGNMENT_ROWS[alignment] * len(_ROTATION_COLUMNS)
+                                     + _ROTATION_COLUMNS[rotation]]
+
+
+# Marks a key that is not in the dictionary
+_MISSING = object()
+
+# Defines that are only computed on first access
+_LAZY_DEFINES = {'LTSPICE_LIBRARY_DEFAULT_LOC': get_library_default_location,
+                 **{key: functools.partial(_build_text_table, key) for key in _TEXT_TABLES}}
+
+
 class Defines:
     """ Class for defines."""
+    __slots__ = ('total_dict', 'text_styles')
+    total_dict: dict
+    text_styles: dict
 
     def get_define(self, key):
         """Function to retrieve a define
@@ -31,11 +658,13 @@ class Defines:
         :parameter key: Key to be searched in the dictionary
         :type key: str
         :return: The dictionary entry"""
-        try:
-            return self.total_dict[key]
-        except KeyError as err:
-            print(err)
-            return
+        value = self.total_dict.get(key, _MISSING)
+        if value is _MISSING:
+            if key not in _LAZY_DEFINES:
+                logger.warning('Unknown define key: %s', key)
+                return
+            value = self.total_dict[key] = _LAZY_DEFINES[key]()
+        return value
 
     def set_define(self, key, value):
         """Function to change a value of a default define
@@ -45,726 +674,63 @@ class Defines:
         :parameter value: Value of the key
         :type value: various
         """
-        try:
-            self.total_dict[key] = value
-        except KeyError as err:
-            print(err)
+        # Copy the shared dictionary before the first change
+        if self.total_dict is _TOTAL_DICT:
+            self.total_dict = dict(_TOTAL_DICT)
+        self.total_dict[key] = value
+        # Cached text styles might depend on the changed define
+        self.text_styles.clear()
+
+    def get_text_style(self, text_alignment, rotation, font_size):
+        """Function to get the style of a text. Styles are cached until a define is changed
+
+        :parameter text_alignment: Alignment of the text
+        :type text_alignment: str
+        :parameter rotation: Rotation of the symbol, with ``ML`` appended for texts with multiple lines
+        :type rotation: str
+        :parameter font_size: LTSpice font size of the text
+        :type font_size: int
+        :return: horizontal alignment, vertical alignment, rotation angle and font size before text scaling
+        :rtype: tuple
+        """
+        key = (text_alignment, rotation, font_size)
+        style = self.text_styles.get(key)
+        if style is None:
+            text_key = (text_alignment, rotation)
+            style = self.text_styles[key] = (
+                ANCHOR_NAMES[self.get_define('TEXT_HORIZONTAL_ALIGNMENTS')[text_key]],
+                ANCHOR_NAMES[self.get_define('TEXT_VERTICAL_ALIGNMENTS')[text_key]],
+                self.__get_rotation_angle(text_alignment, rotation),
+                self.get_define('DEFAULT_FONT_SIZE') * self.get_define('LTSPICE_FONTSIZES')[font_size])
+        return style
+
+    def __get_rotation_angle(self, text_alignment, rotation):
+        """Function to get the rotation angle of a text. A changed TEXT_ROTATION_ANGLES define is used instead of
+        the default angles
+
+        :parameter text_alignment: Alignment of the text
+        :type text_alignment: str
+        :parameter rotation: Rotation of the symbol
+        :type rotation: str
+        :return: rotation angle in degrees
+        """
+        angles = self.total_dict.get('TEXT_ROTATION_ANGLES')
+        if angles is None:
+            return get_rotation_angle(text_alignment, rotation)
+        return angles[text_alignment, rotation]
 
     def __init__(self):
-        """Generates a hardcoded dictionary for all LTSpice parameters"""
-        self.total_dict = {
-            # Default location of the LTSpice App
-            'LTSPICE_APP_DEFAULT_LOC': '/Applications/LTspice.app',
-            'LTSPICE_LIBRARY_DEFAULT_LOC': '/Users/' + get_user() + '/Library/Application Support/LTspice/lib/sym/',
-
-            # Parameters of a sinus source
-            'SOURCE_PARAMETERS_SINE': {'DC_Offset': 0,
-                                       'Amplitude': 1,
-                                       'Frequency': 2,
-                                       'Delay': 3,
-                                       'Dampfing_factor': 4,
-                                       'Phase': 5,
-                                       'Cycles': 6},
-
-            'SOURCE_TYPES': ['SINE'],
-
-            'ASC_COMPONENT_NAME_START': 'InstName',
-
-            'ASC_COMPONENT_VALUE_START': 'Value',
-
-            'SPICE_DIRECTIVES': ['.tran',
-                                 '.ac',
-                                 '.dc',
-                                 '.noise',
-                                 '.tf',
-                                 '.op'],
-
-            'LTSPICE_RUN_TIME': 1,
-
-            'DEFAULT_ALIGNMENT_MAPPER': {'LEFT': 'Left',
-                                         'CENTER': 'Center',
-                                         'RIGHT': 'Right',
-                                         'TOP': 'Top',
-                                         'BOTTOM': 'Bottom',
-                                         'VLEFT': 'VLeft',
-                                         'VCENTER': 'VCenter',
-                                         'VRIGHT': 'VRight',
-                                         'VTOP': 'VTop',
-                                         'VBOTTOM': 'VBottom'},
-
-            'DEFAULT_LINE_STYLES': {0: '-',
-                                    1: '--',
-                                    2: ':',
-                                    3: '-.',
-                                    4: '-..'},
-
-            'DEFAULT_FIG_SIZE': (20, 10),
-
-            'DEFAULT_FONT_SIZE': 14,
-
-            'LTSPICE_FONTSIZES': {0: 0.625,
-                                  1: 1.0,
-                                  2: 1.5,
-                                  3: 2.0,
-                                  4: 2.5,
-                                  5: 3.5,
-                                  6: 5.0,
-                                  7: 7.0},
-
-            'DEFAULT_JUNCTION_SIZE': 12,
-
-            'PLOT_NO_OF_COORDINATES': {'WINDOW': 4,
-                                       'PIN': 3,
-                                       'Version': 1,
-                                       'CIRCLE': 4,
-                                       'LINE': 5,
-                                       'RECTANGLE': 4,
-                                       'ARC': 9,
-                                       'TEXT': 2},
-
-            'PLOT_KEYS': ['LINE',
-                          'CIRCLE',
-                          'ARC',
-                          'RECTANGLE',
-                          'WINDOW',
-                          'TEXT',
-                          'PIN'],
-
-            'WINDOW_TYPES': {0: 'Prefix',
-                             3: 'Value',
-                             123: 'Value2',
-                             39: 'SpiceLine'},
-
-            'TEXT_VERTICAL_ALIGNMENTS': {'Left': {'R0': 'center',
-                                                  'R90': 'top',
-                                                  'R180': 'center',
-                                                  'R270': 'bottom',  # ver 25.04
-
-                                                  'M0': 'center',
-                                                  'M90': 'top',
-                                                  'M180': 'center',
-                                                  'M270': 'bottom',  # ver 25.04
-
-                                                  'R0ML': 'top',
-                                                  'R90ML': 'top',
-                                                  'R180ML': 'center',
-                                                  'R270ML': 'bottom',
-
-                                                  'M0ML': 'top',
-                                                  'M90ML': 'top',
-                                                  'M180ML': 'center',
-                                                  'M270ML': 'center'
-                                                  },
-
-                                         'Center': {'R0': 'center',
-                                                    'R90': 'center',
-                                                    'R180': 'center',
-                                                    'R270': 'center',
-
-                                                    'M0': 'center',
-                                                    'M90': 'center',
-                                                    'M180': 'center',
-                                                    'M270': 'center',
-
-                                                    'R0ML': 'center',
-                                                    'R90ML': 'center',
-                                                    'R180ML': 'center',
-                                                    'R270ML': 'center',
-
-                                                    'M0ML': 'center',
-                                                    'M90ML': 'center',
-                                                    'M180ML': 'center',
-                                                    'M270ML': 'center'
-                                                    },
-
-                                         'Right': {'R0': 'center',
-                                                   'R90': 'bottom',
-                                                   'R180': 'center',
-                                                   'R270': 'top',  # ver 25.04
-
-                                                   'M0': 'center',
-                                                   'M90': 'bottom',  # ver 25.04
-                                                   'M180': 'center',
-                                                   'M270': 'top',  # ver 25.04
-
-                                                   'R0ML': 'center',
-                                                   'R90ML': 'bottom',
-                                                   'R180ML': 'center',
-                                                   'R270ML': 'top',
-
-                                                   'M0ML': 'center',
-                                                   'M90ML': 'bottom',
-                                                   'M180ML': 'center',
-                                                   'M270ML': 'top'
-                                                   },
-
-                                         'Top': {'R0': 'top',
-                                                 'R90': 'center',  # ver 25.04
-                                                 'R180': 'bottom',  # ver 25.04
-                                                 'R270': 'center',  # ver 25.04
-
-                                                 'M0': 'top',  # ver 25.04
-                                                 'M90': 'center',  # ver 25.04
-                                                 'M180': 'bottom',  # ver 25.04
-                                                 'M270': 'center',
-
-                                                 'R0ML': 'top',
-                                                 'R90ML': 'top',
-                                                 'R180ML': 'center',
-                                                 'R270ML': 'bottom',
-
-                                                 'M0ML': 'center',
-                                                 'M90ML': 'top',
-                                                 'M180ML': 'center',
-                                                 'M270ML': 'bottom'
-                                                 },
-
-                                         'Bottom': {'R0': 'bottom',
-                                                    'R90': 'bottom',
-                                                    'R180': 'top',
-                                                    'R270': 'center',  # ver 25.04
-
-                                                    'M0': 'bottom',  # ver 25.04
-                                                    'M90': 'center',
-                                                    'M180': 'top',  # ver 25.04
-                                                    'M270': 'center',  # ver 25.04
-
-                                                    'R0ML': 'bottom',
-                                                    'R90ML': 'bottom',
-                                                    'R180ML': 'center',
-                                                    'R270ML': 'top',
-
-                                                    'M0ML': 'center',
-                                                    'M90ML': 'bottom',
-                                                    'M180ML': 'center',
-                                                    'M270ML': 'top'
-                                                    },
-
-                                         'VLeft': {'R0': 'bottom',
-                                                   'R90': 'top',
-                                                   'R180': 'center',
-                                                   'R270': 'center',
-
-                                                   'M0': 'center',
-                                                   'M90': 'top',
-                                                   'M180': 'bottom',
-                                                   'M270': 'center',
-
-                                                   'R0ML': 'bottom',
-                                                   'R90ML': 'top',
-                                                   'R180ML': 'center',
-                                                   'R270ML': 'center',
-
-                                                   'M0ML': 'center',
-                                                   'M90ML': 'top',
-                                                   'M180ML': 'bottom',
-                                                   'M270ML': 'center'
-                                                   },
-
-                                         'VCenter': {'R0': 'center',
-                                                     'R90': 'center',
-                                                     'R180': 'center',
-                                                     'R270': 'center',
-
-                                                     'M0': 'center',
-                                                     'M90': 'center',
-                                                     'M180': 'center',
-                                                     'M270': 'center',
-
-                                                     'R0ML': 'center',
-                                                     'R90ML': 'center',
-                                                     'R180ML': 'center',
-                                                     'R270ML': 'center',
-
-                                                     'M0ML': 'center',
-                                                     'M90ML': 'center',
-                                                     'M180ML': 'center',
-                                                     'M270ML': 'center'
-                                                     },
-
-                                         'VRight': {'R0': 'top',
-                                                    'R90': 'center',
-                                                    'R180': 'bottom',
-                                                    'R270': 'center',
-
-                                                    'M0': 'top',
-                                                    'M90': 'center',
-                                                    'M180': 'bottom',
-                                                    'M270': 'center',
-
-                                                    'R0ML': 'top',
-                                                    'R90ML': 'center',
-                                                    'R180ML': 'bottom',
-                                                    'R270ML': 'center',
-
-                                                    'M0ML': 'top',
-                                                    'M90ML': 'center',
-                                                    'M180ML': 'bottom',
-                                                    'M270ML': 'center'
-                                                    },
-
-                                         'VTop': {'R0': 'center',
-                                                  'R90': 'top',
-                                                  'R180': 'center',
-                                                  'R270': 'bottom',
-
-                                                  'M0': 'center',
-                                                  'M90': 'top',
-                                                  'M180': 'center',
-                                                  'M270': 'bottom',
-
-                                                  'R0ML': 'center',
-                                                  'R90ML': 'top',
-                                                  'R180ML': 'center',
-                                                  'R270ML': 'bottom',
-
-                                                  'M0ML': 'center',
-                                                  'M90ML': 'top',
-                                                  'M180ML': 'center',
-                                                  'M270ML': 'bottom'
-                                                  },
-
-                                         'VBottom': {'R0': 'center',
-                                                     'R90': 'bottom',
-                                                     'R180': 'center',
-                                                     'R270': 'top',
-
-                                                     'M0': 'center',
-                                                     'M90': 'bottom',
-                                                     'M180': 'center',
-                                                     'M270': 'top',
-
-                                                     'R0ML': 'center',
-                                                     'R90ML': 'bottom',
-                                                     'R180ML': 'center',
-                                                     'R270ML': 'top',
-
-                                                     'M0ML': 'center',
-                                                     'M90ML': 'bottom',
-                                                     'M180ML': 'center',
-                                                     'M270ML': 'top'
-                                                     }
-                                         },
-
-            'TEXT_HORIZONTAL_ALIGNMENTS': {'Left': {'R0': 'left',
-                                                    'R90': 'center',
-                                                    'R180': 'right',
-                                                    'R270': 'center',  # ver 25.04
-
-                                                    'M0': 'right',  # ver 25.04
-                                                    'M90': 'center',
-                                                    'M180': 'left',  # ver 25.04
-                                                    'M270': 'center',  # ver 25.04
-
-                                                    'R0ML': 'left',
-                                                    'R90ML': 'center',
-                                                    'R180ML': 'right',
-                                                    'R270ML': 'left',
-
-                                                    'M0ML': 'right',
-                                                    'M90ML': 'center',
-                                                    'M180ML': 'left',
-                                                    'M270ML': 'left'
-                                                    },
-
-                                           'Center': {'R0': 'center',
-                                                      'R90': 'center',
-                                                      'R180': 'center',
-                                                      'R270': 'center',
-
-                                                      'M0': 'center',
-                                                      'M90': 'center',
-                                                      'M180': 'center',
-                                                      'M270': 'center',
-
-                                                      'R0ML': 'center',
-                                                      'R90ML': 'center',
-                                                      'R180ML': 'center',
-                                                      'R270ML': 'center',
-
-                                                      'M0ML': 'center',
-                                                      'M90ML': 'center',
-                                                      'M180ML': 'center',
-                                                      'M270ML': 'center'
-                                                      },
-
-                                           'Right': {'R0': 'right',
-                                                     'R90': 'center',
-                                                     'R180': 'left',
-                                                     'R270': 'center',  # ver 25.04
-
-                                                     'M0': 'left',  # ver 25.04
-                                                     'M90': 'center',  # ver 25.04
-                                                     'M180': 'right',
-                                                     'M270': 'center',  # ver 25.04
-
-                                                     'R0ML': 'right',
-                                                     'R90ML': 'right',
-                                                     'R180ML': 'right',
-                                                     'R270ML': 'right',
-
-                                                     'M0ML': 'right',
-                                                     'M90ML': 'right',
-                                                     'M180ML': 'right',
-                                                     'M270ML': 'right'
-                                                     },
-
-                                           'Top': {'R0': 'center',
-                                                   'R90': 'right',  # ver 25.04
-                                                   'R180': 'center',
-                                                   'R270': 'left',  # ver 25.04
-
-                                                   'M0': 'center',
-                                                   'M90': 'left',  # ver 25.04
-                                                   'M180': 'center',
-                                                   'M270': 'right',
-
-                                                   'R0ML': 'center',
-                                                   'R90ML': 'center',
-                                                   'R180ML': 'center',
-                                                   'R270ML': 'center',
-
-                                                   'M0ML': 'center',
-                                                   'M90ML': 'center',
-                                                   'M180ML': 'center',
-                                                   'M270ML': 'center'
-                                                   },
-
-                                           'Bottom': {'R0': 'center',
-                                                      'R90': 'left',
-                                                      'R180': 'center',
-                                                      'R270': 'right',
-
-                                                      'M0': 'center',
-                                                      'M90': 'right',  # ver 25.04
-                                                      'M180': 'center',
-                                                      'M270': 'left',
-
-                                                      'R0ML': 'center',
-                                                      'R90ML': 'center',
-                                                      'R180ML': 'center',
-                                                      'R270ML': 'center',
-
-                                                      'M0ML': 'center',
-                                                      'M90ML': 'center',
-                                                      'M180ML': 'center',
-                                                      'M270ML': 'center'
-                                                      },
-
-                                           'VLeft': {'R0': 'center',
-                                                     'R90': 'center',
-                                                     'R180': 'right',
-                                                     'R270': 'right',  # ver 01.05
-
-                                                     'M0': 'right',
-                                                     'M90': 'center',
-                                                     'M180': 'left',
-                                                     'M270': 'left',
-
-                                                     'R0ML': 'center',
-                                                     'R90ML': 'center',
-                                                     'R180ML': 'right',
-                                                     'R270ML': 'left',
-
-                                                     'M0ML': 'right',
-                                                     'M90ML': 'center',
-                                                     'M180ML': 'left',
-                                                     'M270ML': 'left'
-                                                     },
-
-                                           'VCenter': {'R0': 'center',
-                                                       'R90': 'center',
-                                                       'R180': 'center',
-                                                       'R270': 'center',
-
-                                                       'M0': 'center',
-                                                       'M90': 'center',
-                                                       'M180': 'center',
-                                                       'M270': 'center',
-
-                                                       'R0ML': 'center',
-                                                       'R90ML': 'center',
-                                                       'R180ML': 'center',
-                                                       'R270ML': 'center',
-
-                                                       'M0ML': 'center',
-                                                       'M90ML': 'center',
-                                                       'M180ML': 'center',
-                                                       'M270ML': 'center'
-                                                       },
-
-                                           'VRight': {'R0': 'center',
-                                                      'R90': 'right',
-                                                      'R180': 'center',
-                                                      'R270': 'left',
-
-                                                      'M0': 'center',
-                                                      'M90': 'left',  # ver 01.05
-                                                      'M180': 'center',
-                                                      'M270': 'left',
-
-                                                      'R0ML': 'center',
-                                                      'R90ML': 'left',
-                                                      'R180ML': 'center',
-                                                      'R270ML': 'left',
-
-                                                      'M0ML': 'center',
-                                                      'M90ML': 'left',
-                                                      'M180ML': 'center',
-                                                      'M270ML': 'left'
-                                                      },
-
-                                           'VTop': {'R0': 'left',
-                                                    'R90': 'center',
-                                                    'R180': 'right',
-                                                    'R270': 'center',
-
-                                                    'M0': 'right',
-                                                    'M90': 'center',
-                                                    'M180': 'left',
-                                                    'M270': 'center',
-
-                                                    'R0ML': 'left',
-                                                    'R90ML': 'center',
-                                                    'R180ML': 'right',
-                                                    'R270ML': 'center',
-
-                                                    'M0ML': 'right',
-                                                    'M90ML': 'center',
-                                                    'M180ML': 'left',
-                                                    'M270ML': 'center'
-                                                    },
-
-                                           'VBottom': {'R0': 'right',
-                                                       'R90': 'center',
-                                                       'R180': 'left',
-                                                       'R270': 'center',
-
-                                                       'M0': 'left',  # ver 25.04
-                                                       'M90': 'center',
-                                                       'M180': 'right',  # ver 25.04
-                                                       'M270': 'center',
-
-                                                       'R0ML': 'left',
-                                                       'R90ML': 'center',
-                                                       'R180ML': 'right',
-                                                       'R270ML': 'center',
-
-                                                       'M0ML': 'right',
-                                                       'M90ML': 'center',
-                                                       'M180ML': 'left',
-                                                       'M270ML': 'center'
-                                                       }
-                                           },
-
-            'TEXT_ROTATION_ANGLES': {'Left': {'R0': 0,
-                                              'R90': 90,
-                                              'R180': 0,
-                                              'R270': 90,
-
-                                              'M0': 0,
-                                              'M90': 90,
-                                              'M180': 0,
-                                              'M270': 90,
-
-                                              'R0ML': 0,
-                                              'R90ML': 90,
-                                              'R180ML': 0,
-                                              'R270ML': 0,
-
-                                              'M0ML': 0,
-                                              'M90ML': 90,
-                                              'M180ML': 0,
-                                              'M270ML': 90
-                                              },
-
-                                     'Center': {'R0': 0,
-                                                'R90': 90,  # ver 25.04
-                                                'R180': 0,
-                                                'R270': 90,
-
-                                                'M0': 0,
-                                                'M90': 90,
-                                                'M180': 0,
-                                                'M270': 90,
-
-                                                'R0ML': 0,
-                                                'R90ML': 90,
-                                                'R180ML': 0,
-                                                'R270ML': 90,
-
-                                                'M0ML': 0,
-                                                'M90ML': 90,
-                                                'M180ML': 0,
-                                                'M270ML': 90
-                                                },
-
-                                     'Right': {'R0': 0,
-                                               'R90': 90,  # ver 25.04
-                                               'R180': 0,
-                                               'R270': 90,
-
-                                               'M0': 0,
-                                               'M90': 90,
-                                               'M180': 0,
-                                               'M270': 90,  # ver 25.04
-
-                                               'R0ML': 0,
-                                               'R90ML': 90,
-                                               'R180ML': 0,
-                                               'R270ML': 90,
-
-                                               'M0ML': 0,
-                                               'M90ML': 90,
-                                               'M180ML': 0,
-                                               'M270ML': 90
-                                               },
-
-                                     'Top': {'R0': 0,
-                                             'R90': 90,  # ver 25.04
-                                             'R180': 0,
-                                             'R270': 90,
-
-                                             'M0': 0,
-                                             'M90': 90,  # ver 25.04
-                                             'M180': 0,
-                                             'M270': 90,
-
-                                             'R0ML': 0,
-                                             'R90ML': 0,
-                                             'R180ML': 0,
-                                             'R270ML': 0,
-
-                                             'M0ML': 0,
-                                             'M90ML': 0,
-                                             'M180ML': 0,
-                                             'M270ML': 0
-                                             },
-
-                                     'Bottom': {'R0': 0,
-                                                'R90': 90,
-                                                'R180': 0,
-                                                'R270': 90,
-
-                                                'M0': 0,
-                                                'M90': 90,  # ver 25.04
-                                                'M180': 0,
-                                                'M270': 90,  # ver 25.04
-
-                                                'R0ML': 0,
-                                                'R90ML': 90,
-                                                'R180ML': 0,
-                                                'R270ML': 90,
-
-                                                'M0ML': 0,
-                                                'M90ML': 90,
-                                                'M180ML': 0,
-                                                'M270ML': 90
-                                                },
-
-                                     'VLeft': {'R0': 90,
-                                               'R90': 0,
-                                               'R180': 0,
-                                               'R270': 0,
-
-                                               'M0': 0,
-                                               'M90': 0,
-                                               'M180': 0,
-                                               'M270': 0,
-
-                                               'R0ML': 90,
-                                               'R90ML': 0,
-                                               'R180ML': 0,
-                                               'R270ML': 0,
-
-                                               'M0ML': 0,
-                                               'M90ML': 0,
-                                               'M180ML': 0,
-                                               'M270ML': 0
-                                               },
-
-                                     'VCenter': {'R0': 90,
-                                                 'R90': 0,
-                                                 'R180': 0,
-                                                 'R270': 0,
-
-                                                 'M0': 0,
-                                                 'M90': 0,
-                                                 'M180': 0,
-                                                 'M270': 0,
-
-                                                 'R0ML': 90,
-                                                 'R90ML': 0,
-                                                 'R180ML': 0,
-                                                 'R270ML': 0,
-
-                                                 'M0ML': 0,
-                                                 'M90ML': 0,
-                                                 'M180ML': 0,
-                                                 'M270ML': 0
-                                                 },
-
-                                     'VRight': {'R0': 90,
-                                                'R90': 0,
-                                                'R180': 90,
-                                                'R270': 0,
-
-                                                'M0': 90,
-                                                'M90': 0,
-                                                'M180': 90,
-                                                'M270': 0,
-
-                                                'R0ML': 90,
-                                                'R90ML': 0,
-                                                'R180ML': 0,
-                                                'R270ML': 0,
-
-                                                'M0ML': 90,
-                                                'M90ML': 0,
-                                                'M180ML': 0,
-                                                'M270ML': 0
-                                                },
-
-                                     'VTop': {'R0': 90,  # ver 25.04
-                                              'R90': 0,
-                                              'R180': 90,  # ver 25.04
-                                              'R270': 0,
-
-                                              'M0': 90,  # ver 25.04
-                                              'M90': 0,
-                                              'M180': 90,  # ver 25.04
-                                              'M270': 0,
-
-                                              'R0ML': 0,
-                                              'R90ML': 0,
-                                              'R180ML': 0,
-                                              'R270ML': 0,
-
-                                              'M0ML': 0,
-                                              'M90ML': 0,
-                                              'M180ML': 0,
-                                              'M270ML': 0
-                                              },
-
-                                     'VBottom': {'R0': 90,  # ver 25.04
-                                                 'R90': 0,
-                                                 'R180': 90,  # ver 25.04
-                                                 'R270': 0,
-
-                                                 'M0': 90,  # ver 25.04
-                                                 'M90': 0,
-                                                 'M180': 90,  # ver 25.04
-                                                 'M270': 0,
-
-                                                 'R0ML': 0,
-                                                 'R90ML': 0,
-                                                 'R180ML': 0,
-                                                 'R270ML': 0,
-
-                                                 'M0ML': 0,
-                                                 'M90ML': 0,
-                                                 'M180ML': 0,
-                                                 'M270ML': 0
-                                                 }
-                                     }
-        }
+        """Uses the hardcoded dictionary of all LTSpice parameters, which is shared until a define is changed"""
+        self.total_dict = _TOTAL_DICT
+        self.text_styles = {}
+
+
+@functools.cache
+def get_defines():
+    """Function to get a Defines object that is shared by all callers. Use a separate ``Defines()`` if values
+    are changed with set_define
+
+    :parameter: None
+    :return: shared Defines object
+    """
+    return Defines()
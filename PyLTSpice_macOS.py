@@ -10,12 +10,17 @@
 # ---------------------------------------------------------------------------------------------------
 """ Implementation of a toolchain for controlling LTSpice on Apple devices in Python
 """
+import functools
 import getpass
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from sys import intern
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-from collections import Counter
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 import filecmp
 import shutil
@@ -29,10 +34,192 @@ import DebugHelpers as debug
 import DefinesDefault
 
 
+# Attribute lines of a symbol in the schematic, Value2 has to be tried before Value
+_SYMATTR_PATTERN = re.compile(r'SYMATTR (InstName|Value2|Value|SpiceLine)\b')
+# Numbers in the lines of a symbol
+_COORDINATE_PATTERN = re.compile(r'-?\d+\.?\d*')
+# Labels starting with an underscore are drawn with an overline, e.g. inverted signals
+_OVERLINE_PATTERN = re.compile(r'^_(.+)$', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=8)
+def _directive_pattern(spice_directives):
+    """Function to compile one pattern for all simulation directives, compiled once per set of directives
+
+    :param spice_directives: Simulation directives, e.g. ``.tran``
+    :type spice_directives: frozenset
+    :return: pattern that finds any of the directives
+    :rtype: re.Pattern
+    """
+    return re.compile('|'.join(map(re.escape, spice_directives)))
+
+
 def check_if_path_exists(path_to_file):
     return os.path.exists(path_to_file)
 
 
+def read_raw_file(path_to_raw_file):
+    """Reads a ``.raw`` file. Files are cached until they are modified, the cache can be emptied with
+    ``read_raw_file.cache_clear()``
+
+    :param path_to_raw_file: Path to the ``.raw`` file
+    :type path_to_raw_file: str
+    :return: simulation data
+    :rtype: RawRead
+    """
+    stat = os.stat(path_to_raw_file)
+    return _read_raw_file(path_to_raw_file, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_raw_file(path_to_raw_file, mtime, size):
+    """Reads a ``.raw`` file. Modification time and size are only part of the cache key
+
+    :param path_to_raw_file: Path to the ``.raw`` file
+    :type path_to_raw_file: str
+    :param mtime: Modification time of the file in ns
+    :type mtime: int
+    :param size: Size of the file in bytes
+    :type size: int
+    :return: simulation data
+    :rtype: RawRead
+    """
+    return RawRead(path_to_raw_file)
+
+
+read_raw_file.cache_clear = _read_raw_file.cache_clear
+
+
+@functools.lru_cache(maxsize=8)
+def _index_symbol_library(path_to_symbol_library):
+    """Function to index all files of a symbol library, the library is only walked once. If files are added to the
+    library at runtime, the index can be emptied with ``_index_symbol_library.cache_clear()``
+
+    :param path_to_symbol_library: Path to the symbol library
+    :type path_to_symbol_library: str
+    :return: full paths of the files by their lower case file names, the first file found wins
+    :rtype: dict
+    """
+    index = {}
+    for root, dirnames, filenames in os.walk(path_to_symbol_library):
+        for file in filenames:
+            index.setdefault(file.lower(), os.path.join(root, file))
+    return index
+
+
+@functools.lru_cache(maxsize=256)
+def _read_symbol_file(path_to_symbol, mtime):
+    """Function to read a ``.asy`` file. Symbols that are used several times in a schematic or in several schematics
+    are only read once, the modification time is only part of the cache key
+
+    :param path_to_symbol: Path to the ``.asy`` file
+    :type path_to_symbol: str
+    :param mtime: Modification time of the file in ns
+    :type mtime: int
+    :return: encoding of the file and the lines without end of line and empty lines
+    :rtype: tuple
+    """
+    # The file is read once and decoded in memory, Latin9 is only tried if it is no valid UTF-8 (or ASCII)
+    with open(path_to_symbol, 'rb') as fid:
+        raw = fid.read()
+    try:
+        encoding = 'utf-8'
+        text = raw.decode(encoding)
+    except UnicodeDecodeError:
+        encoding = 'Latin9'
+        text = raw.decode(encoding)
+    # The lines are stored as tuple, so instances can't change the cached data
+    return encoding, tuple(line for line in text.splitlines() if line != '')
+
+
+def _preload_symbol_files(paths_to_symbols):
+    """Function to read several ``.asy`` files in parallel into the cache of :func:`_read_symbol_file`. Reading files
+    releases the GIL, so the file system latencies overlap
+
+    :param paths_to_symbols: Paths to the ``.asy`` files, duplicates and None are ignored
+    :type paths_to_symbols: iterable
+    :return: void
+    """
+    paths_to_symbols = {path for path in paths_to_symbols if path}
+    if len(paths_to_symbols) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(16, len(paths_to_symbols))) as executor:
+        # list() waits for all reads and raises the first error
+        list(executor.map(lambda path: _read_symbol_file(path, os.stat(path).st_mtime_ns), paths_to_symbols))
+
+
+# Samples of the unit circle, full ellipses are scaled from these instead of evaluating cos and sin every time
+_UNIT_CIRCLE_COS = np.cos(np.linspace(0, 2 * np.pi, 1000))
+_UNIT_CIRCLE_SIN = np.sin(np.linspace(0, 2 * np.pi, 1000))
+
+# Matrices that rotate and mirror symbol coordinates (x, y) into the orientation of the symbol in the schematic
+_ROTATION_MATRICES = {'R0': np.array([[1, 0], [0, 1]]),
+                      'R90': np.array([[0, -1], [1, 0]]),
+                      'R180': np.array([[-1, 0], [0, -1]]),
+                      'R270': np.array([[0, 1], [-1, 0]]),
+                      'M0': np.array([[-1, 0], [0, 1]]),
+                      'M90': np.array([[0, 1], [1, 0]]),
+                      'M180': np.array([[1, 0], [0, -1]]),
+                      'M270': np.array([[0, -1], [-1, 0]])}
+
+# Direction (dx, dy) in which a label is moved by its offset, for each group of rotations and text alignment
+_OFFSET_DIRECTIONS = ((('R0', 'M180'), {'RIGHT': (-1, 0), 'LEFT': (1, 0), 'TOP': (0, 1), 'BOTTOM': (0, -1),
+                                        'VRIGHT': (0, 1), 'VLEFT': (0, -1)}),
+                      (('R90', 'M90'), {'RIGHT': (0, -1), 'LEFT': (0, 1), 'TOP': (1, 0), 'BOTTOM': (-1, 0),
+                                        'VRIGHT': (0, 1), 'VLEFT': (0, -1)}),
+                      (('R270', 'M270'), {'RIGHT': (0, 1), 'LEFT': (0, -1), 'TOP': (-1, 0), 'BOTTOM': (1, 0),
+                                          'VRIGHT': (0, 1), 'VLEFT': (0, -1)}),
+                      (('R180', 'M0'), {'RIGHT': (1, 0), 'LEFT': (-1, 0), 'TOP': (0, -1), 'BOTTOM': (0, 1),
+                                        'VRIGHT': (0, -1), 'VLEFT': (0, 1)}))
+# Same directions keyed by (rotation, upper case text alignment)
+_OFFSET_TABLE = {(rotation, alignment): direction
+                 for rotations, directions in _OFFSET_DIRECTIONS
+                 for rotation in rotations
+                 for alignment, direction in directions.items()}
+
+# Minimum number of wire end points for which the compiled junction search is used
+_COMPILED_JUNCTIONS_MIN_SIZE = 100000
+
+
+def _collect_junctions(end_points, junctions):
+    """Function to collect the junctions of sorted wire end points, compiled with numba if it is installed
+
+    :param end_points: Wire end points as (x, y) rows, sorted so that equal points follow each other
+    :type end_points: numpy.ndarray
+    :param junctions: Output for the junctions as (x, y) rows, at least as long as end_points
+    :type junctions: numpy.ndarray
+    :return: number of junctions
+    :rtype: int
+    """
+    count = 0
+    run_start = 0
+    for i in range(1, end_points.shape[0] + 1):
+        if (i == end_points.shape[0] or end_points[i, 0] != end_points[run_start, 0] or
+                end_points[i, 1] != end_points[run_start, 1]):
+            # A junction is a point where at least three wire ends meet
+            if i - run_start >= 3:
+                junctions[count, 0] = end_points[run_start, 0]
+                junctions[count, 1] = end_points[run_start, 1]
+                count += 1
+            run_start = i
+    return count
+
+
+@functools.cache
+def _compiled_junction_search():
+    """Function to compile _collect_junctions with numba on first use. Importing numba is slow, so it is only
+    attempted for very large schematics
+
+    :parameter: None
+    :return: compiled function or None if numba is not installed
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(_collect_junctions)
+
+
 class LTC:
     """Class to generate the LTSpice object
 
@@ -46,7 +233,8 @@ class LTC:
     :param simulate_data: Boolean whether a simulation is required. This can be used to create a single plot of
         the schematic or if a ``.raw`` file already exists. Default: True
     :type simulate_data: Bool, optional
-    :param ltspice_run_time: Time before LTSpice is terminated. Useful for longer simulations. Default: 1s
+    :param ltspice_run_time: Maximum time before LTSpice is terminated. LTSpice is terminated earlier as soon as
+        the simulation has finished. Useful for longer simulations. Default: 1s
     :type ltspice_run_time: int, optional
     :param verbose: Boolean to determine the verbose output of the LTC object. Default: False
     :type verbose: Bool, optional
@@ -60,8 +248,16 @@ class LTC:
                  verbose=False):
         """Constructor method"""
 
-        # Attempt to have C/C++ style defines file
-        self.__defs = DefinesDefault.Defines()
+        # Attempt to have C/C++ style defines file, LTC does not change it and can use the shared one
+        self.__defs = DefinesDefault.get_defines()
+        # LTSpice process of a running simulation
+        self.__LtSpiceProcess = None
+        # Content of the .asc file that belongs to the current simulation results
+        self.__SimulatedAscData = None
+        # True if components were changed since the .asc file was written last
+        self.__AscChanged = False
+        # Components whose values changed since the schematic was updated last
+        self.__ChangedComponents = set()
 
         # Configure LTC object
         self.simulate_data = simulate_data
@@ -130,7 +326,7 @@ class LTC:
             # check for simulation directive
             if self.simulate_data:
                 if not (self.__check_for_simulation_directive()):
-                    print("Did not find a simulation directive in the form of " + str(self.__spiceDirectives))
+                    print("Did not find a simulation directive in the form of " + str(sorted(self.__spiceDirectives)))
                     return
                 else:
                     # Check if an instance of LTspice is running, should be terminated before we continue
@@ -142,18 +338,26 @@ class LTC:
                         return
                     else:
                         print("Running LTSpice to generate simulation files")
-                        self.run_ltspice()
+                        self.__start_ltspice()
             else:
                 print('+++')
                 print('Simulation disabled.')
                 print('If you wish to simulate run the call with \'simulate_data=True\'')
                 print('+++')
 
-            if self.verbose:
-                print("Creating dictionaries")
-            self.__asc_create_component_dicts()
-            # Generate schematic object
-            self.schematic = Schematic(self.rawData, path_to_symbol_library=self.path_to_ltspice_library)
+            try:
+                if self.verbose:
+                    print("Creating dictionaries")
+                self.__asc_create_component_dicts()
+                # Generate schematic object
+                self.schematic = Schematic(self.rawData, path_to_symbol_library=self.path_to_ltspice_library)
+                # The schematic was processed while LTSpice was running, now collect the simulation results
+                if self.__LtSpiceProcess is not None:
+                    self.__wait_for_ltspice()
+            finally:
+                # LTSpice is still running if processing the schematic failed
+                if self.__LtSpiceProcess is not None:
+                    self.__stop_ltspice()
 
     def get_trace_data(self, trace_name):
         """ Retrieve simulation data of a trace
@@ -170,6 +374,21 @@ class LTC:
             print('Simulation was disabled.')
             print('Initialize with \'simulate_data=True\' to get simulation results')
 
+    def get_trace_data_bulk(self, trace_names):
+        """ Retrieve simulation data of several traces with a single call
+
+        :parameter trace_names: Names or indices of the traces to be retrieved
+        :type trace_names: list
+        :return: values of each trace, in the order of ``trace_names``
+        :rtype: list
+        """
+        # Check if the simulation is enabled
+        if self.simulate_data:
+            return [self.simulationData.get_trace(trace_name).data for trace_name in trace_names]
+        else:
+            print('Simulation was disabled.')
+            print('Initialize with \'simulate_data=True\' to get simulation results')
+
     # Method for creating a backup file before heavy editing in the original
     def __create_backup_file(self):
         """Creating a backup file of the original .asc file
@@ -177,8 +396,8 @@ class LTC:
         :parameter: None
         :return: void"""
         if os.path.isfile(self.__PathOnly + '/' + self.__FilenameOnly + '.asc_bak'):
-            if (not filecmp.cmp(self.__PathOnly + '/' + self.__FilenameOnly + '.asc',
-                                self.__PathOnly + '/' + self.__FilenameOnly + '.asc_bak')):
+            if (not self.__backup_is_up_to_date(self.__PathOnly + '/' + self.__FilenameOnly + '.asc',
+                                                self.__PathOnly + '/' + self.__FilenameOnly + '.asc_bak')):
                 if self.verbose:
                     print("Updating backup file in: " + self.__PathOnly + self.__FilenameOnly + '.asc_bak')
                 shutil.copyfile(self.PathToAscFile, self.__PathOnly + '/' + self.__FilenameOnly + '.asc_bak')
@@ -190,6 +409,26 @@ class LTC:
                 print("Creating backup file in: " + self.__PathOnly + self.__FilenameOnly + '.asc_bak')
             shutil.copyfile(self.PathToAscFile, self.__PathOnly + '/' + self.__FilenameOnly + '.asc_bak')
 
+    @staticmethod
+    def __backup_is_up_to_date(path_to_file, path_to_backup_file):
+        """Checks if the backup file has the same content as the file
+
+        :param path_to_file: Path to the file
+        :type path_to_file: str
+        :param path_to_backup_file: Path to the backup file
+        :type path_to_backup_file: str
+        :return: True if the backup is up to date
+        :rtype: Bool
+        """
+        file_stat = os.stat(path_to_file)
+        backup_stat = os.stat(path_to_backup_file)
+        if file_stat.st_size != backup_stat.st_size:
+            return False
+        # The file was not modified after the backup was copied, there is no need to compare the content
+        if file_stat.st_mtime_ns <= backup_stat.st_mtime_ns:
+            return True
+        return filecmp.cmp(path_to_file, path_to_backup_file, shallow=False)
+
     # Method to read the asc file into a list
     def __get_asc_file_content(self):
         """Reads in the content of the asc file
@@ -197,19 +436,13 @@ class LTC:
         :param: None
         :return: void
         """
+        # The file is read once, the encoding (utf-16-le or latin9) is detected from its content
         try:
-            schematic = debug.get_raw_asc_data(self.PathToAscFile)
-            print('utf-16-le')
-            if len(schematic) == 1:
-                print('latin9')
-                schematic = debug.get_raw_asc_data(self.PathToAscFile, encoding='ISO-8859-1')
-        except UnicodeDecodeError as err:
-            try:
-                schematic = debug.get_raw_asc_data(self.PathToAscFile, encoding='ISO-8859-1')
-                print('latin9')
-            except Exception as err:
-                print('In :' + str(self.PathToAscFile))
-                print(err)
+            schematic = debug.get_raw_asc_data(self.PathToAscFile, encoding=None)
+        except Exception as err:
+            print('In :' + str(self.PathToAscFile))
+            print(err)
+            schematic = []
 
         self.rawData = schematic
 
@@ -222,6 +455,13 @@ class LTC:
         :return: True if LTSpice runs already, False if no LTSpice process is found
         :rtype: Bool
         """
+        # pgrep asks the kernel once instead of querying every process separately
+        try:
+            return subprocess.run(['pgrep', '-i', processName],
+                                  stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL).returncode == 0
+        except OSError:
+            pass
         # Loop through currently running proesses
         for proc in psutil.process_iter():
             try:
@@ -244,19 +484,120 @@ class LTC:
         :return: void
         """
         if self.simulate_data:
-            # Open LTSpice with file and run simulation to generate .raw files
-            proc = subprocess.Popen([self.path_to_ltspice_app + '/Contents/MacOS/LTspice',
-                                     '-Run',
-                                     self.PathToAscFile])
-            # Let some time pass in order to generate the .raw file etc.
-            time.sleep(self.LtSpiceRunTime)
-            # Killing the process prevents the .net file from being deleted
-            proc.terminate()
-            self.simulationData = RawRead(self.__PathOnly + '/' + self.__FilenameOnly + '.raw')
+            self.__start_ltspice()
+            self.__wait_for_ltspice()
         else:
             print('Simulation was disabled.')
             print('Initialize with \'simulate_data=True\' to run simulation.')
 
+    def __start_ltspice(self):
+        """Start LTSpice in the background. The simulation runs while the schematic is processed,
+        ``__wait_for_ltspice`` collects the results.
+
+        :parameter: None
+        :return: void
+        """
+        self.__RunningAscData = tuple(self.rawData)
+        # Remember the log of the last run so that it is not mistaken for the current one
+        self.__OldLogStat = self.__get_file_stat(self.__PathOnly + '/' + self.__FilenameOnly + '.log')
+        # Open LTSpice with file and run simulation to generate .raw files
+        # File descriptors opened by Python are not inherited anyway (PEP 446), without close_fds
+        # CPython can start LTSpice with posix_spawn instead of fork and exec
+        self.__LtSpiceProcess = subprocess.Popen([self.path_to_ltspice_app + '/Contents/MacOS/LTspice',
+                                                  '-Run',
+                                                  self.PathToAscFile],
+                                                 stdout=subprocess.DEVNULL,
+                                                 stderr=subprocess.DEVNULL,
+                                                 close_fds=False)
+
+    def __wait_for_ltspice(self):
+        """Wait for the simulation started by ``__start_ltspice`` and read the ``.raw`` file
+
+        :parameter: None
+        :return: void
+        """
+        path_to_log_file = self.__PathOnly + '/' + self.__FilenameOnly + '.log'
+        proc = self.__LtSpiceProcess
+        # Wait until the simulation has finished, LtSpiceRunTime is only the upper limit.
+        # The clock starts here, the simulation may already have finished while the schematic was processed
+        deadline = time.monotonic() + self.LtSpiceRunTime
+        poll_interval = self.__defs.get_define('LTSPICE_POLL_INTERVAL')
+        # Results of an incomplete run are not reused by update()
+        self.__SimulatedAscData = None
+        try:
+            finished = self.__simulation_finished(path_to_log_file, self.__OldLogStat)
+            exited = False
+            while not finished and not exited and time.monotonic() < deadline:
+                try:
+                    proc.wait(timeout=poll_interval)
+                    exited = True
+                except subprocess.TimeoutExpired:
+                    pass
+                # If LTSpice exited by itself, the log file tells whether the simulation finished
+                finished = self.__simulation_finished(path_to_log_file, self.__OldLogStat)
+            if finished:
+                self.__SimulatedAscData = self.__RunningAscData
+            elif exited:
+                print('LTSpice exited before the simulation finished.')
+                print('The .raw file might be incomplete.')
+            else:
+                print('Simulation did not finish within ' + str(self.LtSpiceRunTime) + ' s.')
+                print('The .raw file might be incomplete, increase LtSpiceRunTime if necessary.')
+        finally:
+            self.__stop_ltspice()
+        self.simulationData = read_raw_file(self.__PathOnly + '/' + self.__FilenameOnly + '.raw')
+
+    def __stop_ltspice(self):
+        """Terminate LTSpice started by ``__start_ltspice``
+
+        :parameter: None
+        :return: void
+        """
+        # Killing the process prevents the .net file from being deleted
+        self.__LtSpiceProcess.terminate()
+        # Reap the process, otherwise it shows up as a zombie LTSpice process
+        self.__LtSpiceProcess.wait()
+        self.__LtSpiceProcess = None
+
+    @staticmethod
+    def __get_file_stat(path_to_file):
+        """Returns modification time and size of a file
+
+        :param path_to_file: Path to the file
+        :type path_to_file: str
+        :return: (mtime in ns, size in bytes) or None if the file does not exist
+        :rtype: tuple
+        """
+        try:
+            stat = os.stat(path_to_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def __simulation_finished(self, path_to_log_file, old_log_stat):
+        """Checks if LTSpice has written the log file of a finished simulation
+
+        LTSpice writes the log file after the .raw file is complete and finishes it with the elapsed time.
+
+        :param path_to_log_file: Path to the .log file of the simulation
+        :type path_to_log_file: str
+        :param old_log_stat: Stat of the log file before the simulation was started
+        :type old_log_stat: tuple
+        :return: True if the simulation has finished
+        :rtype: bool
+        """
+        log_stat = self.__get_file_stat(path_to_log_file)
+        if log_stat is None or log_stat == old_log_stat:
+            return False
+        try:
+            with open(path_to_log_file, 'rb') as log_file:
+                log_content = log_file.read()
+        except OSError:
+            return False
+        # Depending on the version LTSpice writes the log as UTF-16 LE or as ASCII
+        return (b'Total elapsed time' in log_content
+                or 'Total elapsed time'.encode('utf-16-le') in log_content)
+
     # Create dictionaries for value changes etc
     def __asc_create_component_dicts(self):
         """Function to create a dictionary for the single components and the assigned values
@@ -267,29 +608,27 @@ class LTC:
         self.__AscComponentNameIdx = {}
         self.__AscComponentRawLine = {}
         self.__AscComponentValue = {}
-        counter = 0
+        self.__AscComponentValueOffset = {}
         # TODO: Add separate line for simulation directive
         # tmp_sim = line[line.find('!*') + 2:].replace('\\n', '\n')
         # if tmp_sim[0] == ' ':
         #     tmp_sim = tmp_sim[1:]
         # self.simulation_command = tmp_sim
-        for line in self.rawData:
-            if (idx := line.find(self.__defs.get_define('ASC_COMPONENT_NAME_START'))) >= 0:
-                identifier = line[idx + len(self.__defs.get_define('ASC_COMPONENT_NAME_START')) + 1:-1]
-                value_idx = self.rawData[counter + 1].find(self.__defs.get_define('ASC_COMPONENT_VALUE_START'))
-
-                value = self.rawData[counter + 1][
-                        value_idx + len(self.__defs.get_define('ASC_COMPONENT_VALUE_START')) + 1:-1]
-
-                if len(self.__AscComponentNameIdx) == 0:
-                    self.__AscComponentNameIdx[identifier] = counter
-                    self.__AscComponentValue[identifier] = value
-                    self.__AscComponentRawLine[identifier] = self.rawData[counter + 1]
-                else:
-                    self.__AscComponentNameIdx.update({identifier: counter})
-                    self.__AscComponentValue.update({identifier: value})
-                    self.__AscComponentRawLine.update({identifier: self.rawData[counter + 1]})
-            counter += 1
+        # Look up the defines once instead of in every line
+        name_start = self.__defs.get_define('ASC_COMPONENT_NAME_START')
+        name_offset = len(name_start) + 1
+        value_start = self.__defs.get_define('ASC_COMPONENT_VALUE_START')
+        value_offset = len(value_start) + 1
+        for counter, line in enumerate(self.rawData):
+            if (idx := line.find(name_start)) >= 0:
+                identifier = line[idx + name_offset:-1]
+                value_line = self.rawData[counter + 1]
+                value_idx = value_line.find(value_start)
+
+                self.__AscComponentNameIdx[identifier] = counter
+                self.__AscComponentValue[identifier] = value_line[value_idx + value_offset:-1]
+                self.__AscComponentValueOffset[identifier] = value_idx + value_offset
+                self.__AscComponentRawLine[identifier] = value_line
 
         self.get_component_names_and_values()
 
@@ -303,18 +642,32 @@ class LTC:
         :parameter parameter: If component is a multi value component, specify what will be changed. E.g. amplitude of a sinus. Default: None
         :type parameter: str, optional"""
         component_value_str = str(component_value)
+        self.__AscChanged = True
+        self.__ChangedComponents.add(component_name)
         # Get old value
         self.__component_old_val = self.__AscComponentValue[component_name]
+        old_val_upper = self.__component_old_val.upper()
         for source_type in self.__defs.get_define('SOURCE_TYPES'):
-            if self.__component_old_val.upper().find(source_type) >= 0:
+            if old_val_upper.find(source_type) >= 0:
                 self.__change_sinusoidal_source(component_name, component_value, parameter)
             # TODO: Cover other formats
             else:
-                # Update new value
-                self.__AscComponentValue[component_name] = component_value_str
-                # Update raw line
-                self.__AscComponentRawLine[component_name] = self.__AscComponentRawLine[component_name].replace(
-                    self.__component_old_val, component_value_str)
+                self.__set_component_value(component_name, component_value_str)
+
+    def __set_component_value(self, component_name, component_value_str):
+        """Function to set the value of a component and its raw line
+
+        :param component_name: Name of the component to be changed
+        :type component_name: str
+        :param component_value_str: New value of the component
+        :type component_value_str: str
+        """
+        # Update new value
+        self.__AscComponentValue[component_name] = component_value_str
+        # Update raw line, the value starts at a known offset and ends before the line break
+        raw_line = self.__AscComponentRawLine[component_name]
+        self.__AscComponentRawLine[component_name] = (raw_line[:self.__AscComponentValueOffset[component_name]] +
+                                                      component_value_str + raw_line[-1:])
 
     def __change_sinusoidal_source(self, component_name, component_value, parameter):
         # TODO: Add support for all parameters of a voltage source (AC etc)
@@ -331,23 +684,17 @@ class LTC:
         # Split into single fields
         # tmp_vals = [s for s in re.findall(r'\b\d+\b', self.__component_old_val)]
         tmp_vals = self.__component_old_val[len('SINE') + 1:-1].split(' ')
+        source_parameters = self.__defs.get_define('SOURCE_PARAMETERS_SINE')
         # Sanity check
-        if len(tmp_vals) > len(self.__defs.get_define('SOURCE_PARAMETERS_SINE').keys()):
+        if len(tmp_vals) > len(source_parameters):
             print('SINE source: More parameters detected than available.')
             return
         # Assign new value to respecitve parameter
         else:
-            tmp_vals[self.__defs.get_define('SOURCE_PARAMETERS_SINE')[parameter]] = component_value
+            tmp_vals[source_parameters[parameter]] = component_value
             # Generate value string
-            value_string = str(tmp_vals[0])
-            for i in range(1, len(tmp_vals)):
-                value_string = value_string + ' ' + str(tmp_vals[i])
-            component_value_str = 'SINE(' + value_string + ')'
-        # Update new value
-        self.__AscComponentValue[component_name] = component_value_str
-        # Update raw line
-        self.__AscComponentRawLine[component_name] = self.__AscComponentRawLine[component_name].replace(
-            self.__component_old_val, component_value_str)
+            component_value_str = 'SINE(' + ' '.join(map(str, tmp_vals)) + ')'
+        self.__set_component_value(component_name, component_value_str)
 
     # Write asc file
     def update(self):
@@ -363,12 +710,48 @@ class LTC:
             new_asc_file[self.__AscComponentNameIdx[key] + 1] = self.__AscComponentRawLine[key]
         # Copy temporary file into actual file
         self.rawData = new_asc_file
-        # Write into .asc file
-        f = open(self.PathToAscFile, "w", encoding='utf-16-le')
-        f.writelines(self.rawData)
-        f.close()
-        self.schematic = Schematic(self.rawData, self.path_to_ltspice_library)
-        self.run_ltspice()
+        # Nothing has changed since the last complete simulation, there is no need to launch LTSpice again
+        if self.simulate_data and tuple(self.rawData) == self.__SimulatedAscData:
+            if self.verbose:
+                print('Schematic did not change. Keeping the current simulation results.')
+            return
+        # Write into .asc file, the file is unchanged if no component was changed since the last write
+        if self.__AscChanged:
+            # Encode everything at once and replace the .asc file with a complete temporary file,
+            # an interrupted write does not leave a broken schematic behind
+            tmp_path_to_asc_file = self.PathToAscFile + '.tmp'
+            # A byte order mark of the schematic is part of the first line and is written back with it
+            with open(tmp_path_to_asc_file, 'wb') as fid:
+                fid.write(''.join(self.rawData).encode('utf-16-le'))
+            os.replace(tmp_path_to_asc_file, self.PathToAscFile)
+            self.__AscChanged = False
+        if self.simulate_data:
+            # Process the schematic while LTSpice is running
+            self.__start_ltspice()
+            try:
+                self.__update_schematic()
+                self.__wait_for_ltspice()
+            finally:
+                # LTSpice is still running if processing the schematic failed
+                if self.__LtSpiceProcess is not None:
+                    self.__stop_ltspice()
+        else:
+            self.__update_schematic()
+            self.run_ltspice()
+
+    def __update_schematic(self):
+        """Function to bring the schematic up to date with the changed component values. Only values can be changed,
+        so the values of the changed symbols are replaced instead of parsing the whole schematic again.
+
+        :parameter: None
+        :return: void
+        """
+        for component_name in self.__ChangedComponents:
+            if not self.schematic.set_symbol_value(component_name, self.__AscComponentValue[component_name]):
+                # Fall back to parsing the schematic if the symbol is not known
+                self.schematic = Schematic(self.rawData, self.path_to_ltspice_library)
+                break
+        self.__ChangedComponents.clear()
 
     def get_component_names_and_values(self, verbose=False):
         """Get component names and values in the schematic.
@@ -390,12 +773,13 @@ class LTC:
         :return: True if directive is found, False if no directive is found.
         :rtype: Bool
         """
+        # One pattern for all directives, each line is scanned only once
+        directive_pattern = _directive_pattern(frozenset(self.__spiceDirectives))
         # Loop from the last line, since the directive is usually at the end
-        for line in self.rawData[::-1]:
-            if line.find('TEXT') >= 0:
-                if line.find('!') >= 0:
-                    if any(simulation_command in line for simulation_command in self.__spiceDirectives):
-                        return True
+        for line in reversed(self.rawData):
+            if line.startswith('TEXT') and '!' in line:
+                if directive_pattern.search(line):
+                    return True
         return False
 
 
@@ -441,7 +825,14 @@ class Schematic:
 
             self.verbose = verbose
 
+            # Axes of the last plot, the dynamic artists and the background that is restored when only they are redrawn
+            self.__axes = None
+            self.__dynamic_artists = []
+            self.__background = None
+
             self.__create_plot_data()
+            # All wires as rows of x1, y1, x2, y2 for junction search and plotting
+            self.__wire_coord = np.array(self.plot_data.get('WIRE', []), dtype=np.int32).reshape(-1, 4)
             self.__find_junctions()
         else:
             print('Raw data appears to be empty. Aborting.')
@@ -453,31 +844,18 @@ class Schematic:
         :parameter: None
         :return: void
         """
-        if 'WIRE' in self.plot_data:
-            x = []
-            y = []
-            for elem in self.plot_data['WIRE']:
-                x.extend(elem[::2])
-                y.extend(elem[1::2])
-
-            x_indices = {}
-
-            self.__junction_coord = []
-
-            for elem in x:
-                tmp = [i for i, x in enumerate(x) if x == elem]
-                if len(tmp) >= 3:
-                    x_indices[elem] = tmp
-
-            keys = x_indices.keys()
-
-            for key in keys:
-                selected_elements = [y[index] for index in x_indices[key]]
-                tmp_occurences = Counter(selected_elements)
-                tmp_keys = tmp_occurences.keys()
-                for tmp_key in tmp_keys:
-                    if (tmp_occurences[tmp_key] >= 3):
-                        self.__junction_coord.append([key, tmp_key])
+        if len(self.__wire_coord) > 0:
+            # All wire end points as (x, y) rows
+            end_points = self.__wire_coord.reshape(-1, 2)
+            collect = _compiled_junction_search() if len(end_points) >= _COMPILED_JUNCTIONS_MIN_SIZE else None
+            if collect is None:
+                # A junction is a point where at least three wire ends meet
+                unique_points, counts = np.unique(end_points, axis=0, return_counts=True)
+                self.__junction_coord = unique_points[counts >= 3].tolist()
+            else:
+                end_points = end_points[np.lexsort((end_points[:, 1], end_points[:, 0]))]
+                junctions = np.empty_like(end_points)
+                self.__junction_coord = junctions[:collect(end_points, junctions)].tolist()
         else:
             self.__junction_coord = []
 
@@ -511,7 +889,7 @@ class Schematic:
         for line in self.raw_schematic[idx + 1:]:
             if self.verbose:
                 print(line)
-            if line.split(' ')[0] == 'SYMBOL':
+            if line.startswith('SYMBOL '):
                 break
             elif (counter >= no_of_lines_after_idx) or \
                     (found_name and found_value and found_value2 and found_spice_line):
@@ -526,17 +904,18 @@ class Schematic:
                     print('Value2: ' + str(value2))
                     print('Spice Line: ' + str(spice_line))
                 return name, value, value2, spice_line
-            elif line.find('SYMATTR') >= 0:
-                if (line.find('InstName') >= 0) and (not found_name):
+            elif match := _SYMATTR_PATTERN.match(line):
+                attribute = match.group(1)
+                if attribute == 'InstName' and (not found_name):
                     name = self.__extract_attributes(line)
                     found_name = True
-                elif (line.find('Value2') >= 0) and (not found_value2):
+                elif attribute == 'Value2' and (not found_value2):
                     value2 = self.__extract_attributes(line)
                     found_value2 = True
-                elif (line.find('Value') >= 0) and (not found_value):
+                elif attribute == 'Value' and (not found_value):
                     value = self.__extract_attributes(line)
                     found_value = True
-                elif (line.find('SpiceLine') >= 0) and (not found_spice_line):
+                elif attribute == 'SpiceLine' and (not found_spice_line):
                     spice_line = self.__extract_attributes(line)
                     found_spice_line = True
 
@@ -559,84 +938,124 @@ class Schematic:
         :parameter: None
         :return: void
         """
+        # Only lines starting with one of these keywords are plotted, all other lines are skipped without splitting
+        handlers = {'WIRE': self.__add_wire,
+                    'LINE': self.__add_line,
+                    'FLAG': self.__add_flag,
+                    'SYMBOL': self.__add_symbol,
+                    'TEXT': self.__add_text}
+        keywords = tuple(keyword + ' ' for keyword in handlers)
         for i in range(2, len(self.raw_schematic)):
-            tmp_line = self.raw_schematic[i].split(' ')
+            line = self.raw_schematic[i]
+            if line.startswith(keywords):
+                tmp_line = line.split(' ')
+                handlers[tmp_line[0]](i, tmp_line)
+
+    def __add_wire(self, i, tmp_line):
+        """Function to add a wire to the plot data
+
+        :param i: Index of the line in the schematic
+        :type i: int
+        :param tmp_line: Line split at spaces
+        :type tmp_line: str list
+        """
+        position = [int(x) for x in tmp_line[1:]]
+        self.__write_to_PlotData_dict(key='WIRE', value=position)
 
-            # TODO: Separate function for line and line styles
-            if tmp_line[0] == 'WIRE' or tmp_line[0] == 'LINE':
-                identifier = tmp_line[0]
-                if identifier == 'WIRE':
-                    position = [int(x) for x in tmp_line[1:]]
-                else:
-                    position = [int(x) for x in tmp_line[2:-1]]
-                    # TODO: LoopGain.asc requires different Line positions
-                    if len(position) < 4:
-                        position = [int(x) for x in tmp_line[2:]]
-
-                self.__write_to_PlotData_dict(key=identifier, value=position)
-
-            elif tmp_line[0] == 'FLAG':
-                identifier = tmp_line[0]
-                position = [int(x) for x in tmp_line[1:3]]
-                position.append(' '.join(tmp_line[3:]))
-
-                self.__write_to_PlotData_dict(key=identifier, value=position)
-
-            elif tmp_line[0] == 'SYMBOL':
-                tmp_window = []
-                # A maximum number of 4 windows will be declared after symbol
-                for j in range(4):
-                    try:
-                        tmp_preview_line = self.raw_schematic[i + 1 + j]
-                        # New symbol will start with SYMBOL break the loop then
-                        if tmp_preview_line.split(' ')[0] == 'SYMBOL':
-                            break
-                        elif tmp_preview_line.split(' ')[0] == 'WINDOW':
-                            tmp_window.append(tmp_preview_line)
-                            # print('Found: ' + str(tmp_preview_line))
-                    except IndexError:
-                        pass
-                # print('tmp_window: ' + str(tmp_window))
-                identifier = tmp_line[1]
-                position = [int(x) for x in tmp_line[2:4]]
-                rotation = tmp_line[4]
-                if len(tmp_window) > 0:
-                    name, value, value2, spice_line = self.__find_attributes(idx=i + len(tmp_window))
-                else:
-                    name, value, value2, spice_line = self.__find_attributes(idx=i)
-                # print('+++++')
-                # print('Identifier: ' + str(identifier))
-                # print('Name: ' + str(name))
-                # print('Value: ' + str(value))
-                # print('Value2: ' + str(value2))
-                # print('Spice line: ' + str(spice_line))
-                # print('Window: ' + str(tmp_window))
-
-                if name == '':
-                    name = 'tbd'
-                if value == '':
-                    value = ''
-
-                tmp_symbol = Symbol(symbol_model=identifier, symbol_name=name, symbol_value=value, symbol_value2=value2,
-                                    symbol_spice_line=spice_line,
-                                    symbol_position=position, symbol_rotation=rotation,
-                                    window=tmp_window,
-                                    text_scaling_factor=self.text_scaling,
-                                    path_to_symbol_library=self.path_to_symbol_library,
-                                    defines=self.__defs,
-                                    verbose=self.verbose)
-
-                self.__write_to_PlotData_dict(name, tmp_symbol)
-
-            elif tmp_line[0] == 'TEXT':
-                # print(tmp_line)
-                identifier = tmp_line[0]
-                position = [int(x) for x in tmp_line[1:3]]
-                position.append(tmp_line[3])
-                position.append(int(tmp_line[4]))
-                position.append(' '.join(tmp_line[5:])[1:])
-
-                self.__write_to_PlotData_dict(key=identifier, value=position)
+    def __add_line(self, i, tmp_line):
+        """Function to add a line to the plot data
+
+        :param i: Index of the line in the schematic
+        :type i: int
+        :param tmp_line: Line split at spaces
+        :type tmp_line: str list
+        """
+        # TODO: Separate function for line styles
+        position = [int(x) for x in tmp_line[2:-1]]
+        # TODO: LoopGain.asc requires different Line positions
+        if len(position) < 4:
+            position = [int(x) for x in tmp_line[2:]]
+        self.__write_to_PlotData_dict(key='LINE', value=position)
+
+    def __add_flag(self, i, tmp_line):
+        """Function to add a flag to the plot data
+
+        :param i: Index of the line in the schematic
+        :type i: int
+        :param tmp_line: Line split at spaces
+        :type tmp_line: str list
+        """
+        position = [int(x) for x in tmp_line[1:3]]
+        position.append(' '.join(tmp_line[3:]))
+        self.__write_to_PlotData_dict(key='FLAG', value=position)
+
+    def __add_symbol(self, i, tmp_line):
+        """Function to add a symbol to the plot data
+
+        :param i: Index of the line in the schematic
+        :type i: int
+        :param tmp_line: Line split at spaces
+        :type tmp_line: str list
+        """
+        tmp_window = []
+        # A maximum number of 4 windows will be declared after symbol
+        # The slice ends early at the end of the schematic
+        for tmp_preview_line in self.raw_schematic[i + 1:i + 5]:
+            # New symbol will start with SYMBOL break the loop then
+            if tmp_preview_line.startswith('SYMBOL '):
+                break
+            elif tmp_preview_line.startswith('WINDOW '):
+                tmp_window.append(tmp_preview_line)
+                # print('Found: ' + str(tmp_preview_line))
+        # print('tmp_window: ' + str(tmp_window))
+        identifier = tmp_line[1]
+        position = [int(x) for x in tmp_line[2:4]]
+        # Interned strings make the lookups in the text tables cheaper
+        rotation = intern(tmp_line[4])
+        if len(tmp_window) > 0:
+            name, value, value2, spice_line = self.__find_attributes(idx=i + len(tmp_window))
+        else:
+            name, value, value2, spice_line = self.__find_attributes(idx=i)
+        # print('+++++')
+        # print('Identifier: ' + str(identifier))
+        # print('Name: ' + str(name))
+        # print('Value: ' + str(value))
+        # print('Value2: ' + str(value2))
+        # print('Spice line: ' + str(spice_line))
+        # print('Window: ' + str(tmp_window))
+
+        if name == '':
+            name = 'tbd'
+        if value == '':
+            value = ''
+
+        tmp_symbol = Symbol(symbol_model=identifier, symbol_name=name, symbol_value=value, symbol_value2=value2,
+                            symbol_spice_line=spice_line,
+                            symbol_position=position, symbol_rotation=rotation,
+                            window=tmp_window,
+                            text_scaling_factor=self.text_scaling,
+                            path_to_symbol_library=self.path_to_symbol_library,
+                            defines=self.__defs,
+                            verbose=self.verbose)
+
+        self.__write_to_PlotData_dict(name, tmp_symbol)
+
+    def __add_text(self, i, tmp_line):
+        """Function to add a text to the plot data
+
+        :param i: Index of the line in the schematic
+        :type i: int
+        :param tmp_line: Line split at spaces
+        :type tmp_line: str list
+        """
+        # print(tmp_line)
+        identifier = tmp_line[0]
+        position = [int(x) for x in tmp_line[1:3]]
+        position.append(intern(tmp_line[3]))
+        position.append(int(tmp_line[4]))
+        position.append(' '.join(tmp_line[5:])[1:])
+
+        self.__write_to_PlotData_dict(key=identifier, value=position)
 
     def __write_to_PlotData_dict(self, key, value):
         """Function to write the plot data to the ``plot_data`` dict
@@ -646,10 +1065,7 @@ class Schematic:
         :param value: Value of the key
         :type value: str
         """
-        try:
-            self.plot_data[key].append(value)
-        except:
-            self.plot_data[key] = [value]
+        self.plot_data.setdefault(key, []).append(value)
 
     def __read_schematic(self):
         """ Function to read the schematic in
@@ -663,9 +1079,11 @@ class Schematic:
         tmp_schematic = [w.replace('\n', '') for w in tmp_schematic]
         self.raw_schematic = tmp_schematic
 
-    def __plot_gnd(self, x_pos, y_pos):
+    def __plot_gnd(self, ax, x_pos, y_pos):
         """ Function to plot the GND symbol
 
+        :param ax: Axes to plot in
+        :type ax: matplotlib.axes.Axes
         :param x_pos: x position of the GND symbol
         :type x_pos: int
         :param y_pos: y position of the GND symbol
@@ -678,7 +1096,7 @@ class Schematic:
                  [x_pos, y_pos + vertical_line_length, x_pos + horizontal_line_length / 2, y_pos]]
 
         for line in lines:
-            plt.plot(line[::2], line[1::2], color='tab:blue')
+            ax.plot(line[::2], line[1::2], color='tab:blue')
 
     def plot_schematic(self, figsize=None, verbose=False):
         """ Function to plot the entire schematic
@@ -688,26 +1106,50 @@ class Schematic:
         :param verbose: verbose for plotting
         :type verbose: Bool
         """
+        # Paths are simplified when they are created, the threshold can be changed with
+        # set_define('PATH_SIMPLIFY_THRESHOLD', value)
+        with matplotlib.rc_context({'path.simplify': True,
+                                    'path.simplify_threshold': self.__defs.get_define('PATH_SIMPLIFY_THRESHOLD')}):
+            self.__plot_schematic(figsize=figsize, verbose=verbose)
+
+    def __plot_schematic(self, figsize, verbose):
+        """ Function to plot the entire schematic, see :meth:`plot_schematic`
+
+        :param figsize: figsize
+        :type figsize: tuple
+        :param verbose: verbose for plotting
+        :type verbose: Bool
+        """
         keys = self.plot_data.keys()
 
-        if figsize:
-            plt.figure(figsize=figsize)
-        else:
-            plt.figure(figsize=self.__defs.get_define('DEFAULT_FIG_SIZE'))
+        if not figsize:
+            figsize = self.__defs.get_define('DEFAULT_FIG_SIZE')
+        fig, ax = plt.subplots(figsize=figsize)
+        self.__axes = ax
+        self.__dynamic_artists = []
+        self.__background = None
+        # Every full redraw, e.g. after panning, zooming or resizing, invalidates the stored background
+        fig.canvas.mpl_connect('draw_event', self.__clear_background)
+        # Symbol files are read lazily, read all files of the schematic at once before the symbols are drawn
+        _preload_symbol_files(getattr(elem, 'path_to_symbol', None)
+                              for elements in self.plot_data.values() for elem in elements)
         for key in keys:
+            # Wires and lines are each drawn as one collection instead of one line per element
+            if key == 'WIRE':
+                ax.add_collection(LineCollection(self.__wire_coord.reshape(-1, 2, 2), colors='tab:blue'))
+                continue
+            elif key == 'LINE':
+                ax.add_collection(LineCollection([np.reshape(elem, (-1, 2)) for elem in self.plot_data[key]],
+                                                 linestyles='--', colors='tab:blue'))
+                continue
             for elem in self.plot_data[key]:
                 # print(elem)
                 try:
-                    elem.plot_symbol(verbose=verbose)
+                    elem.plot_symbol(verbose=verbose, ax=ax)
                 except AttributeError:
-                    if key == 'WIRE' or key == 'LINE':
-                        if key == 'WIRE':
-                            plt.plot(elem[::2], elem[1::2], color='tab:blue')
-                        else:
-                            plt.plot(elem[::2], elem[1::2], '--', color='tab:blue')
-                    elif key == 'FLAG':
+                    if key == 'FLAG':
                         if elem[2] == '0':
-                            self.__plot_gnd(x_pos=elem[0], y_pos=elem[1])
+                            self.__plot_gnd(ax, x_pos=elem[0], y_pos=elem[1])
                         else:
                             plot_text(x_y_coordinates=[elem[0], elem[1] - 5], label=elem[2],
                                       text_alignment='Center',
@@ -715,50 +1157,105 @@ class Schematic:
                                       symbol_rotation='R0',
                                       text_scaling_factor=self.text_scaling,
                                       defines=self.__defs,
-                                      verbose=verbose)
+                                      verbose=verbose,
+                                      ax=ax)
 
                     elif key == 'TEXT':
                         # print(elem)
-                        # Drawing the dots draws the plot frame around the entire plot
-                        # Otherwise far out text elements would be outside the frame
-                        plt.plot(elem[0], elem[1], color='w')
                         # Plot the actual text
                         try:
-                            if elem[2].lower() == 'top' or elem[2].lower() == 'bottom':
-                                plot_text(x_y_coordinates=[elem[0], elem[1]], label=elem[4].replace('\\n', '\n'),
-                                          text_alignment=elem[2],
-                                          font_size=elem[3],
-                                          symbol_rotation='R0',
-                                          text_scaling_factor=self.text_scaling,
-                                          defines=self.__defs,
-                                          verbose=verbose)
-                            else:
-                                # TODO: Finish this
-                                plot_text(x_y_coordinates=[elem[0], elem[1]], label=elem[4].replace('\\n', '\n'),
-                                          text_alignment=elem[2],
-                                          font_size=elem[3],
-                                          symbol_rotation='R0',
-                                          text_scaling_factor=self.text_scaling,
-                                          defines=self.__defs,
-                                          verbose=verbose)
+                            plot_text(x_y_coordinates=[elem[0], elem[1]], label=elem[4].replace('\\n', '\n'),
+                                      text_alignment=elem[2],
+                                      font_size=elem[3],
+                                      symbol_rotation='R0',
+                                      text_scaling_factor=self.text_scaling,
+                                      defines=self.__defs,
+                                      verbose=verbose,
+                                      ax=ax)
                         # TODO: Add some kind of error log for easier debug
-                        except AttributeError:
-                            pass
-                        except ValueError:
+                        except (AttributeError, ValueError):
                             pass
 
+        if 'TEXT' in self.plot_data:
+            # The text positions are added to the data limits to draw the plot frame around the entire plot
+            # Otherwise far out text elements would be outside the frame
+            ax.update_datalim([elem[:2] for elem in self.plot_data['TEXT']])
+            ax.autoscale_view()
+
         if len(self.__junction_coord) > 0:
-            for elem in self.__junction_coord:
-                plt.plot(elem[0], elem[1], 'o',
-                         markersize=self.__defs.get_define('DEFAULT_JUNCTION_SIZE') * self.text_scaling,
-                         color='tab:blue')
-
-        plt.gca().invert_yaxis()
-        plt.axis('equal')
-        plt.tick_params(left=False,
-                        labelleft=False,
-                        bottom=False,
-                        labelbottom=False)
+            # All junctions in one call, scatter takes the marker area instead of the size
+            junction_coord = np.asarray(self.__junction_coord)
+            ax.scatter(junction_coord[:, 0], junction_coord[:, 1],
+                       s=(self.__defs.get_define('DEFAULT_JUNCTION_SIZE') * self.text_scaling) ** 2,
+                       marker='o', color='tab:blue')
+
+        ax.invert_yaxis()
+        ax.axis('equal')
+        # Removing the ticks is cheaper than hiding them and their labels
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+    def set_dynamic_overlay(self, artists):
+        """Function to set the artists of the plotted schematic that change between draws, e.g. highlighted wires or
+        labels. Only these artists are redrawn by :meth:`update_dynamic_overlay`
+
+        :param artists: Artists of the plotted schematic
+        :type artists: list
+        :return: void
+        """
+        self.__dynamic_artists = list(artists)
+        for artist in self.__dynamic_artists:
+            artist.set_animated(True)
+        # The background has to be drawn again without the dynamic artists
+        self.__background = None
+
+    def update_dynamic_overlay(self):
+        """Function to redraw the dynamic artists, see :meth:`set_dynamic_overlay`. The rest of the schematic is
+        restored from a copy of the background instead of being drawn again. The background is drawn again on the first
+        call and after every full redraw of the figure, e.g. after panning, zooming or resizing
+
+        :return: void
+        """
+        if self.__axes is None:
+            print('update_dynamic_overlay: Schematic was not plotted yet. Call plot_schematic first.')
+            return
+        canvas = self.__axes.figure.canvas
+        if self.__background is None:
+            canvas.draw()
+            self.__background = canvas.copy_from_bbox(self.__axes.bbox)
+        else:
+            canvas.restore_region(self.__background)
+        for artist in self.__dynamic_artists:
+            self.__axes.draw_artist(artist)
+        canvas.blit(self.__axes.bbox)
+
+    def __clear_background(self, event):
+        """Function to invalidate the background of :meth:`update_dynamic_overlay` when the figure is drawn again
+
+        :param event: Draw event of the canvas
+        :type event: matplotlib.backend_bases.DrawEvent
+        :return: void
+        """
+        self.__background = None
+
+    def set_symbol_value(self, symbol_name, value):
+        """Function to change the value of a symbol, e.g. after the value was changed in the ``.asc`` file
+
+        :param symbol_name: Name of the symbol
+        :type symbol_name: str
+        :param value: New value of the symbol as it is written in the ``.asc`` file
+        :type value: str
+        :return: True if the symbol was found, False otherwise
+        :rtype: Bool
+        """
+        found = False
+        for symbol in self.plot_data.get(symbol_name, []):
+            symbol_labels = getattr(symbol, 'symbol_labels', None)
+            if symbol_labels is not None:
+                # Same as __extract_attributes
+                symbol_labels[3] = value.replace('\"', '')
+                found = True
+        return found
 
     def set_define(self, key, value):
         """Wrapper for :meth:`DefinesDefault.Defines.set_define`"""
@@ -782,7 +1279,7 @@ class Schematic:
 
 
 def plot_text(x_y_coordinates, label, text_alignment, font_size, symbol_rotation, text_scaling_factor, defines,
-              verbose=False):
+              verbose=False, ax=None):
     """Function to plot the labels of a component
 
     :param x_y_coordinates: x and y coordinate of the label
@@ -798,7 +1295,13 @@ def plot_text(x_y_coordinates, label, text_alignment, font_size, symbol_rotation
     :param text_scaling_factor: Scaling factor of the text
     :type text_scaling_factor: float
     :param defines: Defines object
-    :type defines: Defines"""
+    :type defines: Defines
+    :param verbose: Verbose output, default: False
+    :type verbose: Bool, optional
+    :param ax: Axes to plot the label in, default: current axes
+    :type ax: matplotlib.axes.Axes, optional"""
+    if ax is None:
+        ax = plt.gca()
     if verbose:
         try:
             print('*******************')
@@ -808,42 +1311,37 @@ def plot_text(x_y_coordinates, label, text_alignment, font_size, symbol_rotation
             print('plot_text(): text alignment: ' + str(text_alignment))
             print('plot_text(): symbol rotation: ' + str(symbol_rotation))
             print('plot_text(): HA: ' + str(
-                defines.get_define('TEXT_HORIZONTAL_ALIGNMENTS')[text_alignment][symbol_rotation]))
+                DefinesDefault.ANCHOR_NAMES[
+                    defines.get_define('TEXT_HORIZONTAL_ALIGNMENTS')[(text_alignment, symbol_rotation)]]))
             print('plot_text(): VA: ' + str(
-                defines.get_define('TEXT_VERTICAL_ALIGNMENTS')[text_alignment][symbol_rotation]))
+                DefinesDefault.ANCHOR_NAMES[
+                    defines.get_define('TEXT_VERTICAL_ALIGNMENTS')[(text_alignment, symbol_rotation)]]))
             print(
                 'plot_text(): ROT: ' + str(
-                    defines.get_define('TEXT_ROTATION_ANGLES')[text_alignment][symbol_rotation]))
+                    defines.get_define('TEXT_ROTATION_ANGLES')[(text_alignment, symbol_rotation)]))
             print('plot_text(): FONTSIZE: ' + str(
                 defines.get_define('DEFAULT_FONT_SIZE') * defines.get_define('LTSPICE_FONTSIZES')[font_size] *
                 text_scaling_factor))
 
-            plt.plot(x_y_coordinates[0], x_y_coordinates[1], '*', markersize=4)
+            ax.plot(x_y_coordinates[0], x_y_coordinates[1], '*', markersize=4)
         except Exception as excp:
             print(excp)
     # Check if the label contains more than one line
     # Multi Lines have different requirements
     if label.count('\n') > 0:
-        symbol_rotation = symbol_rotation + 'ML'
-    if label[0] == '_':
-        string = '$\overline{' + label[1:] + '}$'
-        plt.text(x_y_coordinates[0], x_y_coordinates[1], string,
-                 horizontalalignment=defines.get_define('TEXT_HORIZONTAL_ALIGNMENTS')[text_alignment][
-                     symbol_rotation],
-                 verticalalignment=defines.get_define('TEXT_VERTICAL_ALIGNMENTS')[text_alignment][symbol_rotation],
-                 rotation=defines.get_define('TEXT_ROTATION_ANGLES')[text_alignment][symbol_rotation],
-                 fontsize=defines.get_define('DEFAULT_FONT_SIZE') * defines.get_define('LTSPICE_FONTSIZES')[
-                     font_size] *
-                          text_scaling_factor)
-    else:
-        plt.text(x_y_coordinates[0], x_y_coordinates[1], label,
-                 horizontalalignment=defines.get_define('TEXT_HORIZONTAL_ALIGNMENTS')[text_alignment][
-                     symbol_rotation],
-                 verticalalignment=defines.get_define('TEXT_VERTICAL_ALIGNMENTS')[text_alignment][symbol_rotation],
-                 rotation=defines.get_define('TEXT_ROTATION_ANGLES')[text_alignment][symbol_rotation],
-                 fontsize=defines.get_define('DEFAULT_FONT_SIZE') * defines.get_define('LTSPICE_FONTSIZES')[
-                     font_size] *
-                          text_scaling_factor)
+        symbol_rotation = intern(symbol_rotation + 'ML')
+    # The style of a label is resolved once per Defines object and reused by all labels with the same style
+    horizontal_alignment, vertical_alignment, rotation, fontsize = defines.get_text_style(text_alignment,
+                                                                                          symbol_rotation, font_size)
+    fontsize = fontsize * text_scaling_factor
+    string = _OVERLINE_PATTERN.sub(r'$\\overline{\1}$', label)
+    # Symbol labels are positioned with one element arrays, the figure can only be drawn with scalar positions
+    x, y = np.ravel(x_y_coordinates).tolist()
+    ax.text(x, y, string,
+            horizontalalignment=horizontal_alignment,
+            verticalalignment=vertical_alignment,
+            rotation=rotation,
+            fontsize=fontsize)
 
 
 class Symbol:
@@ -878,6 +1376,12 @@ class Symbol:
                  symbol_value2=None, symbol_spice_line=None, defines=None, window=None, text_scaling_factor=1,
                  verbose=False, path_to_symbol_library=None):
 
+        # Attempt to have C/C++ style defines file
+        if defines:
+            self.__defs = defines
+        else:
+            self.__defs = DefinesDefault.get_defines()
+
         # Store path to symbol library which is either default or can be customized
         if path_to_symbol_library:
             self.path_to_symbol_library = path_to_symbol_library
@@ -901,27 +1405,45 @@ class Symbol:
             self.symbol_position = symbol_position
             self.symbol_rotation = symbol_rotation
             self.text_scaling_factor = text_scaling_factor
-            if defines:
-                self.__defs = defines
-            else:
-                self.__defs = DefinesDefault.defines()
 
             self.window = None
             if window:
                 self.window = window
 
-            # Store symbol
-            self.raw_symbol = None
-            self.__read_symbol()
-            # Get symbol type
-            self.symbol_type = None
-            self.__get_symbol_type()
-
-            # Generate plot data.
-            # Data needs to be handled according to type
-            self.plot_data = {}
+            # The symbol file is read and the plot data is created on first access,
+            # see raw_symbol, symbol_type and plot_data
             self.plot_texts = {}
-            self.create_plot_data()
+
+    @functools.cached_property
+    def raw_symbol(self):
+        """Lines of the ``.asy`` file, read on first access
+
+        :return: Lines of the symbol file
+        :rtype: str list
+        """
+        return self.__read_symbol()
+
+    @functools.cached_property
+    def symbol_type(self):
+        """Type of the symbol, determined on first access
+
+        :return: Symbol type or None if the symbol file has no type
+        :rtype: str
+        """
+        return self.__get_symbol_type()
+
+    @functools.cached_property
+    def plot_data(self):
+        """Plot data of the symbol, created on first access, see :meth:`create_plot_data`
+
+        :return: Plot data sorted by the identifier of the lines
+        :rtype: dict
+        """
+        # The instance attribute shadows this property while create_plot_data fills it
+        self.plot_data = {}
+        self.__plot_data_index = {}
+        self.create_plot_data()
+        return self.plot_data
 
     def __find_file(self, filename):
         """ Function to retrieve the corrct ``.asy`` file
@@ -934,11 +1456,9 @@ class Symbol:
             raw_file = '/' + filename_internal[idx + 1:]
         else:
             raw_file = '/' + filename_internal
-        for root, dirnames, filenames in os.walk(self.path_to_symbol_library):
-            for file in filenames:
-                tmp_path = os.path.join(root, file.lower())
-                if raw_file.lower() in tmp_path:
-                    return os.path.join(root, file)
+        path_to_file = _index_symbol_library(self.path_to_symbol_library).get(raw_file[1:].lower())
+        if path_to_file is not None:
+            return path_to_file
 
         print('find_file(): File: ' + filename_internal + ' not found! Abort.')
 
@@ -951,41 +1471,15 @@ class Symbol:
             - **x_coordinates** (int) - x coordinate of the input
             - **y_coordinates** (int) -  y coordinate of the input
          """
-        # Non mirrored x and y values
-        if self.symbol_rotation == 'R0':
-            x_coordinates = np.array(tmp_coordinates[::2]) + self.symbol_position[0]
-            y_coordinates = np.array(tmp_coordinates[1::2]) + self.symbol_position[1]
-        elif self.symbol_rotation == 'R90':
-            x_coordinates = -np.array(tmp_coordinates[1::2]) + self.symbol_position[0]
-            y_coordinates = np.array(tmp_coordinates[::2]) + self.symbol_position[1]
-        elif self.symbol_rotation == 'R180':
-            x_coordinates = -np.array(tmp_coordinates[::2]) + self.symbol_position[0]
-            y_coordinates = -np.array(tmp_coordinates[1::2]) + self.symbol_position[1]
-        elif self.symbol_rotation == 'R270':
-            x_coordinates = np.array(tmp_coordinates[1::2]) + self.symbol_position[0]
-            y_coordinates = -np.array(tmp_coordinates[::2]) + self.symbol_position[1]
-
-        # Mirrored x and y values
-        elif self.symbol_rotation == 'M0':
-            x_coordinates = -np.array(tmp_coordinates[::2]) + self.symbol_position[0]
-            y_coordinates = np.array(tmp_coordinates[1::2]) + self.symbol_position[1]
-        elif self.symbol_rotation == 'M270':
-            x_coordinates = -np.array(tmp_coordinates[1::2]) + self.symbol_position[0]
-            y_coordinates = -np.array(tmp_coordinates[::2]) + self.symbol_position[1]
-        elif self.symbol_rotation == 'M180':
-            x_coordinates = np.array(tmp_coordinates[::2]) + self.symbol_position[0]
-            y_coordinates = -np.array(tmp_coordinates[1::2]) + self.symbol_position[1]
-        elif self.symbol_rotation == 'M90':
-            x_coordinates = np.array(tmp_coordinates[1::2]) + self.symbol_position[0]
-            y_coordinates = np.array(tmp_coordinates[::2]) + self.symbol_position[1]
-
+        rotation_matrix = _ROTATION_MATRICES.get(self.symbol_rotation)
         # Debug function. Print unrecognized rotation command
-        else:
+        if rotation_matrix is None:
             print('create_plot_data: Rotation ' + self.symbol_rotation + ' not recognized')
-            x_coordinates = 0
-            y_coordinates = 0
-
-        return x_coordinates, y_coordinates
+            # All points at the origin, so the plot data keeps its shape
+            return np.zeros(len(tmp_coordinates) // 2), np.zeros(len(tmp_coordinates) // 2)
+        # Rotate all points with one matrix product, each row is one (x, y) point
+        points = np.array(tmp_coordinates[:len(tmp_coordinates) // 2 * 2]).reshape(-1, 2) @ rotation_matrix.T
+        return points[:, 0] + self.symbol_position[0], points[:, 1] + self.symbol_position[1]
 
     def __offset_corrector(self, x_coordinates, y_coordinates, text_alignment, offset):
         # TODO: Make sure all labels are corrected
@@ -1003,91 +1497,9 @@ class Symbol:
             - **x_coordinates** (int) - Corrected x-coordinate
             - **y_coordinates** (int) - Corrected y-coordinate
         """
-        if self.symbol_rotation.find('R0') >= 0 or self.symbol_rotation.find('M180') >= 0:
-            if text_alignment.upper() == 'RIGHT':
-                # print('offset_corrector(): R Right, ' + str(offset))
-                x_coordinates -= offset
-            elif text_alignment.upper() == 'LEFT':
-                # print('offset_corrector(): R Left, ' + str(offset))
-                x_coordinates += offset
-            elif text_alignment.upper() == 'TOP':
-                # print('offset_corrector(): R Top, ' + str(offset))
-                y_coordinates += offset
-            elif text_alignment.upper() == 'BOTTOM':
-                # print('offset_corrector(): R Bottom, ' + str(offset))
-                y_coordinates -= offset
-
-            elif text_alignment.upper() == 'VRIGHT':
-                # print('offset_corrector(): R VRight, ' + str(offset))
-                y_coordinates += offset
-            elif text_alignment.upper() == 'VLEFT':
-                # print('offset_corrector(): R VLeft, ' + str(offset))
-                y_coordinates -= offset
-
-        elif self.symbol_rotation.find('R90') >= 0 or self.symbol_rotation.find('M90') >= 0:
-            if text_alignment.upper() == 'RIGHT':
-                # print('offset_corrector(): R Right, ' + str(offset))
-                y_coordinates -= offset
-            elif text_alignment.upper() == 'LEFT':
-                # print('offset_corrector(): R Left, ' + str(offset))
-                y_coordinates += offset
-            elif text_alignment.upper() == 'TOP':
-                # print('offset_corrector(): R Top, ' + str(offset))
-                x_coordinates += offset
-            elif text_alignment.upper() == 'BOTTOM':
-                # print('offset_corrector(): R Bottom, ' + str(offset))
-                x_coordinates -= offset
-
-            elif text_alignment.upper() == 'VRIGHT':
-                # print('offset_corrector(): R VRight, ' + str(offset))
-                y_coordinates += offset
-            elif text_alignment.upper() == 'VLEFT':
-                # print('offset_corrector(): R VLeft, ' + str(offset))
-                y_coordinates -= offset
-
-        elif self.symbol_rotation.find('R270') >= 0 or self.symbol_rotation.find('M270') >= 0:
-            if text_alignment.upper() == 'RIGHT':
-                # print('offset_corrector(): R Right, ' + str(offset))
-                y_coordinates += offset
-            elif text_alignment.upper() == 'LEFT':
-                # print('offset_corrector(): R Left, ' + str(offset))
-                y_coordinates -= offset
-            elif text_alignment.upper() == 'TOP':
-                # print('offset_corrector(): R Top, ' + str(offset))
-                x_coordinates -= offset
-            elif text_alignment.upper() == 'BOTTOM':
-                # print('offset_corrector(): R Bottom, ' + str(offset))
-                x_coordinates += offset
-
-            elif text_alignment.upper() == 'VRIGHT':
-                # print('offset_corrector(): R VRight, ' + str(offset))
-                y_coordinates += offset
-            elif text_alignment.upper() == 'VLEFT':
-                # print('offset_corrector(): R VLeft, ' + str(offset))
-                y_coordinates -= offset
-
-        elif self.symbol_rotation.find('R180') >= 0 or self.symbol_rotation.find('M0') >= 0:
-            if text_alignment.upper() == 'RIGHT':
-                # print('offset_corrector(): M Right, ' + str(offset))
-                x_coordinates += offset
-            elif text_alignment.upper() == 'LEFT':
-                # print('offset_corrector(): M Left, ' + str(offset))
-                x_coordinates -= offset
-            elif text_alignment.upper() == 'TOP':
-                # print('offset_corrector(): M Top, ' + str(offset))
-                y_coordinates -= offset
-            elif text_alignment.upper() == 'BOTTOM':
-                # print('offset_corrector(): M Bottom, ' + str(offset))
-                y_coordinates += offset
-
-            elif text_alignment.upper() == 'VRIGHT':
-                # print('offset_corrector(): M VRight, ' + str(offset))
-                y_coordinates -= offset
-            elif text_alignment.upper() == 'VLEFT':
-                # print('offset_corrector(): M VLeft, ' + str(offset))
-                y_coordinates += offset
-
-        return x_coordinates, y_coordinates
+        # Other alignments, e.g. centered labels, are not moved
+        dx, dy = _OFFSET_TABLE.get((self.symbol_rotation, text_alignment.upper()), (0, 0))
+        return x_coordinates + dx * offset, y_coordinates + dy * offset
 
     def create_plot_data(self):
         """ Function to create the plot data of a symbol
@@ -1095,93 +1507,37 @@ class Symbol:
         :parameter: None
         :return: void
         """
+        no_of_coordinates = self.__defs.get_define('PLOT_NO_OF_COORDINATES')
+        # Lines of all other identifiers with coordinates, e.g. CIRCLE and RECTANGLE, are added by __add_shape
+        handlers = {'WINDOW': self.__add_window,
+                    'TEXT': self.__add_text,
+                    'PIN': self.__add_pin,
+                    'LINE': self.__add_line,
+                    'ARC': self.__add_arc}
         for i in range(2, len(self.raw_symbol)):
             # for line in self.raw_symbol:
             # Extract identifier
             line = self.raw_symbol[i]
-            identifier = line.split(' ')[0]
+            # The line is split once and reused by all branches
+            tmp_split_line = line.split(' ')
+            identifier = tmp_split_line[0]
 
-            if line.find('SYMATTR Value2') >= 0:
-                tmp = ' '.join(line.split(' ')[2:])
-                self.symbol_labels[123] = tmp
-            elif self.symbol_labels[3] == '' and self.symbol_labels[123] == '' and line.find('SYMATTR Value') >= 0:
-                self.symbol_labels[3] = ' '.join(line.split(' ')[-1:])
+            if identifier == 'SYMATTR' and (match := _SYMATTR_PATTERN.match(line)):
+                attribute = match.group(1)
+                if attribute == 'Value2':
+                    self.symbol_labels[123] = ' '.join(tmp_split_line[2:])
+                elif attribute == 'Value' and self.symbol_labels[3] == '' and self.symbol_labels[123] == '':
+                    self.symbol_labels[3] = tmp_split_line[-1]
 
             try:
                 # Extract coordinates only
                 # TODO: Handle other numbers that float around in the lines
                 if self.verbose:
                     print('create plot data: ' + line)
-                tmp_coordinates = self.__get_coordinates(line)[
-                                  :self.__defs.get_define('PLOT_NO_OF_COORDINATES')[identifier]]
-
-                if identifier == 'WINDOW':
-                    # print(line)
-                    # print(tmp_coordinates)
-                    tmp_type = tmp_coordinates[0]
-                    tmp_coordinates = tmp_coordinates[1:-1]
-                    tmp_split_line = line.split(' ')
-                    text_alignment = tmp_split_line[-2]
-                    font_size = int(tmp_split_line[-1])
-
-                    x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
-                    self.__write_to_plot_data_dict(key=identifier, value=[tmp_type, text_alignment,
-                                                                          x_coordinates, y_coordinates, font_size])
-
-                elif identifier == 'TEXT':
-                    tmp_split_line = line.split(' ')
-                    tmp_label = ' '.join(tmp_split_line[5:])
-                    text_alignment = tmp_split_line[3]
-                    font_size = int(tmp_split_line[4])
-
-                    x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
-
-                    self.__write_to_plot_data_dict(key=identifier, value=[tmp_label, text_alignment,
-                                                                          x_coordinates, y_coordinates, font_size])
-                elif identifier == 'PIN' and self.raw_symbol[i + 1].find('PINATTR PinName') >= 0:
-                    # print('PIN: ' + str(line))
-                    # print(str(self.raw_symbol[i+1]))
-                    tmp_split_line = line.split(' ')
-                    tmp_label = ' '.join(self.raw_symbol[i + 1].split(' ')[2:])
-                    text_alignment = self.__defs.get_define('DEFAULT_ALIGNMENT_MAPPER')[tmp_split_line[3]]
-                    font_size = 2
-
-                    x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates[:2])
-                    x_coordinates, y_coordinates = self.__offset_corrector(x_coordinates, y_coordinates,
-                                                                           text_alignment, tmp_coordinates[2])
-
-                    self.__write_to_plot_data_dict(key=identifier, value=[tmp_label, text_alignment,
-                                                                          x_coordinates, y_coordinates, font_size])
-                # Catches pins that don't have a description
-                elif identifier == 'PIN' and not self.raw_symbol[i + 1].find('PINATTR PinName') >= 0:
-                    pass
-
-                elif identifier == 'LINE':
-                    # Line style is only specified if not dashed
-                    if len(tmp_coordinates) > 4:
-                        tmp_line_style = tmp_coordinates[-1]
-                        tmp_coordinates = tmp_coordinates[:-1]
-                    else:
-                        tmp_line_style = 0
-
-                    x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
-
-                    self.__write_to_plot_data_dict(key=identifier, value=[x_coordinates, y_coordinates, tmp_line_style])
-
-                elif identifier == 'ARC':
-                    if len(tmp_coordinates) > 8:
-                        tmp_line_style = tmp_coordinates[-1]
-                        tmp_coordinates = tmp_coordinates[:-1]
-                    else:
-                        tmp_line_style = 0
-
-                    x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
-
-                    self.__write_to_plot_data_dict(key=identifier, value=[x_coordinates, y_coordinates, tmp_line_style])
-                else:
-                    x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
-                    self.__write_to_plot_data_dict(key=identifier, value=[x_coordinates, y_coordinates])
+                # Lines without coordinates, e.g. SYMATTR, raise the KeyError before they are tokenized
+                tmp_coordinates = self.__get_coordinates(line, no_of_coordinates[identifier])
 
+                handlers.get(identifier, self.__add_shape)(i, tmp_split_line, tmp_coordinates)
             except KeyError:
                 pass
 
@@ -1191,8 +1547,7 @@ class Symbol:
             for line in self.window:
                 # print('Update: ' + str(line))
 
-                tmp_coordinates = self.__get_coordinates(line)[
-                                  :self.__defs.get_define('PLOT_NO_OF_COORDINATES')[identifier]]
+                tmp_coordinates = self.__get_coordinates(line, no_of_coordinates[identifier])
                 tmp_type = tmp_coordinates[0]
                 tmp_coordinates = tmp_coordinates[1:-1]
 
@@ -1206,10 +1561,131 @@ class Symbol:
                                                                                    x_coordinates, y_coordinates,
                                                                                    font_size])
 
-    def __plot_ellipse(self, coordinates, linestyle, verbose=False):
+    def __add_window(self, i, tmp_split_line, tmp_coordinates):
+        """Function to add a window, i.e. the position of a value field, to the plot data
+
+        :param i: Index of the line in the symbol
+        :type i: int
+        :param tmp_split_line: Line split at spaces
+        :type tmp_split_line: str list
+        :param tmp_coordinates: Coordinates of the line
+        :type tmp_coordinates: int list
+        """
+        tmp_type = tmp_coordinates[0]
+        tmp_coordinates = tmp_coordinates[1:-1]
+        text_alignment = tmp_split_line[-2]
+        font_size = int(tmp_split_line[-1])
+
+        x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
+        self.__write_to_plot_data_dict(key='WINDOW', value=[tmp_type, text_alignment,
+                                                            x_coordinates, y_coordinates, font_size])
+
+    def __add_text(self, i, tmp_split_line, tmp_coordinates):
+        """Function to add a text to the plot data
+
+        :param i: Index of the line in the symbol
+        :type i: int
+        :param tmp_split_line: Line split at spaces
+        :type tmp_split_line: str list
+        :param tmp_coordinates: Coordinates of the line
+        :type tmp_coordinates: int list
+        """
+        tmp_label = ' '.join(tmp_split_line[5:])
+        text_alignment = tmp_split_line[3]
+        font_size = int(tmp_split_line[4])
+
+        x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
+
+        self.__write_to_plot_data_dict(key='TEXT', value=[tmp_label, text_alignment,
+                                                          x_coordinates, y_coordinates, font_size])
+
+    def __add_pin(self, i, tmp_split_line, tmp_coordinates):
+        """Function to add the name of a pin to the plot data
+
+        :param i: Index of the line in the symbol
+        :type i: int
+        :param tmp_split_line: Line split at spaces
+        :type tmp_split_line: str list
+        :param tmp_coordinates: Coordinates of the line
+        :type tmp_coordinates: int list
+        """
+        # Catches pins that don't have a description
+        if not self.raw_symbol[i + 1].startswith('PINATTR PinName'):
+            return
+        # print('PIN: ' + str(self.raw_symbol[i]))
+        # print(str(self.raw_symbol[i+1]))
+        tmp_label = ' '.join(self.raw_symbol[i + 1].split(' ')[2:])
+        text_alignment = self.__defs.get_define('DEFAULT_ALIGNMENT_MAPPER')[tmp_split_line[3]]
+        font_size = 2
+
+        x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates[:2])
+        x_coordinates, y_coordinates = self.__offset_corrector(x_coordinates, y_coordinates,
+                                                               text_alignment, tmp_coordinates[2])
+
+        self.__write_to_plot_data_dict(key='PIN', value=[tmp_label, text_alignment,
+                                                         x_coordinates, y_coordinates, font_size])
+
+    def __add_line(self, i, tmp_split_line, tmp_coordinates):
+        """Function to add a line to the plot data
+
+        :param i: Index of the line in the symbol
+        :type i: int
+        :param tmp_split_line: Line split at spaces
+        :type tmp_split_line: str list
+        :param tmp_coordinates: Coordinates of the line
+        :type tmp_coordinates: int list
+        """
+        # Line style is only specified if not dashed, the number is resolved to the matplotlib line style once
+        if len(tmp_coordinates) > 4:
+            tmp_line_style = self.__defs.get_define('DEFAULT_LINE_STYLES')[tmp_coordinates[-1]]
+            tmp_coordinates = tmp_coordinates[:-1]
+        else:
+            tmp_line_style = self.__defs.get_define('DEFAULT_LINE_STYLES')[0]
+
+        x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
+
+        self.__write_to_plot_data_dict(key='LINE', value=[x_coordinates, y_coordinates, tmp_line_style])
+
+    def __add_arc(self, i, tmp_split_line, tmp_coordinates):
+        """Function to add an arc to the plot data
+
+        :param i: Index of the line in the symbol
+        :type i: int
+        :param tmp_split_line: Line split at spaces
+        :type tmp_split_line: str list
+        :param tmp_coordinates: Coordinates of the line
+        :type tmp_coordinates: int list
+        """
+        # The number of the line style is resolved to the matplotlib line style once
+        if len(tmp_coordinates) > 8:
+            tmp_line_style = self.__defs.get_define('DEFAULT_LINE_STYLES')[tmp_coordinates[-1]]
+            tmp_coordinates = tmp_coordinates[:-1]
+        else:
+            tmp_line_style = self.__defs.get_define('DEFAULT_LINE_STYLES')[0]
+
+        x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
+
+        self.__write_to_plot_data_dict(key='ARC', value=[x_coordinates, y_coordinates, tmp_line_style])
+
+    def __add_shape(self, i, tmp_split_line, tmp_coordinates):
+        """Function to add a shape without line style, e.g. a circle or a rectangle, to the plot data
+
+        :param i: Index of the line in the symbol
+        :type i: int
+        :param tmp_split_line: Line split at spaces
+        :type tmp_split_line: str list
+        :param tmp_coordinates: Coordinates of the line
+        :type tmp_coordinates: int list
+        """
+        x_coordinates, y_coordinates = self.__coordinate_mapper(tmp_coordinates)
+        self.__write_to_plot_data_dict(key=tmp_split_line[0], value=[x_coordinates, y_coordinates])
+
+    def __plot_ellipse(self, ax, coordinates, linestyle, verbose=False):
         # TODO: Add linestyle support
         """ Function to plot an ellipse
 
+        :parameter ax: Axes to plot the ellipse in
+        :type ax: matplotlib.axes.Axes
         :parameter coordinates: x- and y-coordinates of the ellipse
         :type coordinates: int list
         :parameter linestyle: Line style of the ellipse
@@ -1257,14 +1733,14 @@ class Symbol:
                 print('End phase before correction: ' + str(np.rad2deg(end_phase)) + '(' + str(end_phase) + ')')
 
             # Correct plot direction
-            if self.symbol_rotation.find('R') >= 0:
+            if self.symbol_rotation.startswith('R'):
                 # if both points are in the same half plane, no correction is necessary
                 if not (0 > start_phase > end_phase and end_phase < 0):
                     if start_phase < 0:
                         start_phase += 2 * np.pi
                     if end_phase > start_phase:
                         end_phase -= 2 * np.pi
-            elif self.symbol_rotation.find('M') >= 0:
+            elif self.symbol_rotation.startswith('M'):
                 if not (0 < start_phase < end_phase and end_phase > 0):
                     if start_phase > 0:
                         start_phase -= 2 * np.pi
@@ -1273,26 +1749,34 @@ class Symbol:
 
             plot_phase = np.linspace(start_phase, end_phase,
                                      int(resolution_per_pi / (np.abs(end_phase - start_phase))))
+            cos_phase = np.cos(plot_phase)
+            sin_phase = np.sin(plot_phase, out=plot_phase)
         else:
             start_phase = 0
             end_phase = 2 * np.pi
-            plot_phase = np.linspace(start_phase, end_phase, 1000)
+            cos_phase = _UNIT_CIRCLE_COS
+            sin_phase = _UNIT_CIRCLE_SIN
 
         if verbose:
             print('Start phase: ' + str(np.rad2deg(start_phase)))
             print('End phase: ' + str(np.rad2deg(end_phase)))
 
-        x = center_x + ra * np.cos(plot_phase)
-        y = center_y + rb * np.sin(plot_phase)
+        # Shift in place to avoid another temporary array
+        x = ra * cos_phase
+        x += center_x
+        y = rb * sin_phase
+        y += center_y
 
-        plt.plot(x, y, '-', color='tab:blue')
+        ax.plot(x, y, '-', color='tab:blue')
 
         if verbose:
-            self.__plot_arc_points(coordinates)
+            self.__plot_arc_points(ax, coordinates)
 
-    def __plot_arc_points(self, coordinates, print_coord=False):
+    def __plot_arc_points(self, ax, coordinates, print_coord=False):
         """ Debug function to plot the ellipse points
 
+        :param ax: Axes to plot in
+        :type ax: matplotlib.axes.Axes
         :param coordinates: x- and y-coordinates
         :type coordinates: int list
         :param print_coord: Boolean whether to add a legend with the coordinates or not
@@ -1306,121 +1790,198 @@ class Symbol:
         counter = 0
         color = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red']
         for x_str, y_str, color in zip(x, y, color):
-            plt.plot(x_str, y_str, '*', markersize=10, color=color,
-                     label='p' + str(counter + 1) + ': (' + str(x_str) + ',' + str(y_str) + ')')
+            ax.plot(x_str, y_str, '*', markersize=10, color=color,
+                    label='p' + str(counter + 1) + ': (' + str(x_str) + ',' + str(y_str) + ')')
             if print_coord:
                 print('p' + str(counter + 1) + ': (' + str(x_str) + ',' + str(y_str) + ')')
             counter += 1
 
         # plot lines
-        plt.plot(x[:2], y[:2], '--')
+        ax.plot(x[:2], y[:2], '--')
 
         if len(coordinates) > 4:
             x_center = np.mean(x[:2])
             y_center = np.mean(y[:2])
-            plt.plot(x_center, y_center, '*', markersize=10, color='tab:purple')
-
-            plt.plot([x_center, x[2]], [y_center, y[2]], ':', label='start phase')
-            plt.plot([x_center, x[3]], [y_center, y[3]], ':', label='end phase')
+            ax.plot(x_center, y_center, '*', markersize=10, color='tab:purple')
 
-    def __plot_rectangle(self, coordinates):
-        """Function to plot a rectangle
-
-        :param coordinates: x- and y-coordinates of the rectangle
-        :type coordinates: int list
-        :return: void
-        """
-        lines = [[coordinates[0][0], coordinates[0][0]], [coordinates[1][0], coordinates[1][1]],
-                 [coordinates[0][1], coordinates[0][1]], [coordinates[1][0], coordinates[1][1]],
-                 [coordinates[0][0], coordinates[0][1]], [coordinates[1][0], coordinates[1][0]],
-                 [coordinates[0][0], coordinates[0][1]], [coordinates[1][1], coordinates[1][1]]
-                 ]
+            ax.plot([x_center, x[2]], [y_center, y[2]], ':', label='start phase')
+            ax.plot([x_center, x[3]], [y_center, y[3]], ':', label='end phase')
 
-        for i in range(int(len(lines) / 2)):
-            plt.plot(lines[2 * i], lines[2 * i + 1], color='tab:blue')
-
-    def plot_symbol(self, verbose=False):
+    def plot_symbol(self, verbose=False, ax=None):
         """ Function to plot the symbol
 
         :param verbose: Verbose output of the function
         :type verbose: Bool
+        :param ax: Axes to plot the symbol in, default: current axes
+        :type ax: matplotlib.axes.Axes, optional
         """
+        plot_data = self.plot_data
+        # All elements are plotted into the same axes, the current axes are only looked up once
+        if ax is None:
+            ax = plt.gca()
+        handlers = {'LINE': self.__plot_lines,
+                    'CIRCLE': self.__plot_circles,
+                    'RECTANGLE': self.__plot_rectangles,
+                    'ARC': self.__plot_arcs,
+                    'WINDOW': self.__plot_windows,
+                    'TEXT': self.__plot_labels,
+                    'PIN': self.__plot_labels}
         for key in self.__defs.get_define('PLOT_KEYS'):
+            handler = handlers.get(key)
+            elements = plot_data.get(key)
+            # Keys without handler or without elements in this symbol are skipped
+            if handler is None or not elements:
+                continue
             try:
-                if key == 'LINE':
-                    for coordinates in self.plot_data[key]:
-                        plt.plot(coordinates[0], coordinates[1],
-                                 self.__defs.get_define('DEFAULT_LINE_STYLES')[coordinates[2]], color='tab:blue')
-                elif key == 'CIRCLE':
-                    for coordinates in self.plot_data[key]:
-                        self.__plot_ellipse(coordinates, linestyle='-', verbose=verbose)
-                elif key == 'RECTANGLE':
-                    for coordinates in self.plot_data[key]:
-                        self.__plot_rectangle(coordinates)
-                elif key == 'ARC':
-                    for coordinates in self.plot_data[key]:
-                        try:
-                            self.__plot_ellipse(coordinates[:2],
-                                                linestyle=self.__defs.get_define('DEFAULT_LINE_STYLES')[
-                                                    coordinates[-1]],
-                                                verbose=verbose)
-                        except ValueError as error:
-                            print(err)
-                elif key == 'WINDOW':
-                    for coordinates in self.plot_data[key]:
-                        if self.symbol_labels[coordinates[0]]:
-                            label = self.symbol_labels[coordinates[0]]
-                            text_alignment = coordinates[1]
-                            fontsize = coordinates[-1]
-
-                            plot_text(x_y_coordinates=[coordinates[2], coordinates[3]],
-                                      label=label,
-                                      text_alignment=text_alignment,
-                                      font_size=fontsize,
-                                      symbol_rotation=self.symbol_rotation,
-                                      text_scaling_factor=self.text_scaling_factor,
-                                      defines=self.__defs,
-                                      verbose=verbose)
-                elif key == 'TEXT' or key == 'PIN':
-                    for coordinates in self.plot_data[key]:
-                        label = coordinates[0]
-                        text_alignment = coordinates[1]
-                        fontsize = coordinates[-1]
-                        # print('###')
-                        # print('plot key: ' + key)
-                        # print('label: ' + label)
-                        # print('text al: ' + text_alignment)
-                        # print('fontsize: ' + str(fontsize))
-                        plot_text(x_y_coordinates=[coordinates[2], coordinates[3]],
-                                  label=label,
-                                  text_alignment=text_alignment,
-                                  font_size=fontsize,
-                                  symbol_rotation=self.symbol_rotation,
-                                  text_scaling_factor=self.text_scaling_factor,
-                                  defines=self.__defs,
-                                  verbose=verbose)
-
+                handler(ax, elements, verbose)
             except KeyError as err:
                 # print("Key error: {0}".format(err))
                 pass
 
-    def __get_coordinates(self, line):
+    def __plot_lines(self, ax, elements, verbose):
+        """ Function to plot the lines of the symbol
+
+        :param ax: Axes to plot in
+        :type ax: matplotlib.axes.Axes
+        :param elements: Plot data of the lines
+        :type elements: list
+        :param verbose: Verbose output of the function
+        :type verbose: Bool
+        """
+        # Styles like '-..' for LTSpice style 4 are format strings with markers, which a collection does not take
+        collection_elements = []
+        for elem in elements:
+            if isinstance(elem[2], str) and elem[2] not in Line2D.lineStyles:
+                ax.plot(elem[0], elem[1], elem[2], color='tab:blue')
+            else:
+                collection_elements.append(elem)
+        if not collection_elements:
+            return
+        # x- and y-coordinates of all lines as one (lines, x/y, points) array, the collection takes
+        # (lines, points, x/y). The line style is set per segment
+        coordinates = np.array([elem[:2] for elem in collection_elements], dtype=float)
+        ax.add_collection(LineCollection(coordinates.transpose(0, 2, 1),
+                                         linestyles=[elem[2] for elem in collection_elements],
+                                         colors='tab:blue'))
+
+    def __plot_circles(self, ax, elements, verbose):
+        """ Function to plot the circles of the symbol
+
+        :param ax: Axes to plot in
+        :type ax: matplotlib.axes.Axes
+        :param elements: Plot data of the circles
+        :type elements: list
+        :param verbose: Verbose output of the function
+        :type verbose: Bool
+        """
+        for coordinates in elements:
+            self.__plot_ellipse(ax, coordinates, linestyle='-', verbose=verbose)
+
+    def __plot_rectangles(self, ax, elements, verbose):
+        """ Function to plot the rectangles of the symbol
+
+        :param ax: Axes to plot in
+        :type ax: matplotlib.axes.Axes
+        :param elements: Plot data of the rectangles
+        :type elements: list
+        :param verbose: Verbose output of the function
+        :type verbose: Bool
+        """
+        # Opposite corners of all rectangles as one (rectangles, x/y, corners) array. The outlines are closed lines
+        # through all four corners and back to the first one
+        corners = np.array([elem[:2] for elem in elements], dtype=float)
+        outlines = np.stack((corners[:, 0, [0, 0, 1, 1, 0]], corners[:, 1, [0, 1, 1, 0, 0]]), axis=-1)
+        ax.add_collection(LineCollection(outlines, colors='tab:blue'))
+
+    def __plot_arcs(self, ax, elements, verbose):
+        """ Function to plot the arcs of the symbol
+
+        :param ax: Axes to plot in
+        :type ax: matplotlib.axes.Axes
+        :param elements: Plot data of the arcs
+        :type elements: list
+        :param verbose: Verbose output of the function
+        :type verbose: Bool
+        """
+        for coordinates in elements:
+            try:
+                self.__plot_ellipse(ax, coordinates[:2], linestyle=coordinates[-1], verbose=verbose)
+            except ValueError as error:
+                print(error)
+
+    def __plot_windows(self, ax, elements, verbose):
+        """ Function to plot the value fields of the symbol, e.g. name and value
+
+        :param ax: Axes to plot in
+        :type ax: matplotlib.axes.Axes
+        :param elements: Plot data of the windows
+        :type elements: list
+        :param verbose: Verbose output of the function
+        :type verbose: Bool
+        """
+        symbol_labels = self.symbol_labels
+        symbol_plot_text = self.__symbol_plot_text(ax, verbose)
+        # Windows of empty or unknown value fields are skipped before anything is plotted
+        windows = [(coordinates, label) for coordinates in elements
+                   if (label := symbol_labels.get(coordinates[0]))]
+        for coordinates, label in windows:
+            symbol_plot_text(x_y_coordinates=(coordinates[2], coordinates[3]),
+                             label=label,
+                             text_alignment=coordinates[1],
+                             font_size=coordinates[-1])
+
+    def __plot_labels(self, ax, elements, verbose):
+        """ Function to plot the texts and pin names of the symbol
+
+        :param ax: Axes to plot in
+        :type ax: matplotlib.axes.Axes
+        :param elements: Plot data of the texts or pins
+        :type elements: list
+        :param verbose: Verbose output of the function
+        :type verbose: Bool
+        """
+        symbol_plot_text = self.__symbol_plot_text(ax, verbose)
+        for coordinates in elements:
+            # print('###')
+            # print('label: ' + coordinates[0])
+            # print('text al: ' + coordinates[1])
+            # print('fontsize: ' + str(coordinates[-1]))
+            symbol_plot_text(x_y_coordinates=(coordinates[2], coordinates[3]),
+                             label=coordinates[0],
+                             text_alignment=coordinates[1],
+                             font_size=coordinates[-1])
+
+    def __symbol_plot_text(self, ax, verbose):
+        """ Function to get :func:`plot_text` with the arguments that are the same for all labels of the symbol
+
+        :param ax: Axes to plot the labels in
+        :type ax: matplotlib.axes.Axes
+        :param verbose: Verbose output of the function
+        :type verbose: Bool
+        :return: plot_text that only takes the coordinates, label, text alignment and font size
+        :rtype: functools.partial
+        """
+        return functools.partial(plot_text,
+                                 symbol_rotation=self.symbol_rotation,
+                                 text_scaling_factor=self.text_scaling_factor,
+                                 defines=self.__defs,
+                                 verbose=verbose,
+                                 ax=ax)
+
+    def __get_coordinates(self, line, no_of_coordinates=None):
         """Function to extract the coordinates
 
         :param line: Line of the coordinates to be extracted
         :type line: str
+        :param no_of_coordinates: Number of coordinates to be extracted, all if None. Default: None
+        :type no_of_coordinates: int, optional
         :return: list of coordinates
         :rtype: int list
         """
-        try:
-            return [int(s) for s in re.findall('-?\d+\.?\d*', line)]
-        except ValueError as err:
-            if self.verbose:
-                print('Error in get_coordinates: ' + line)
-                print(err)
-            # This should catch some value errors where the value at the end of the line is not used for the coordinates
-            return [int(float(s)) for s in re.findall('-?\d+\.?\d*', line)]
-            pass
+        # Numbers after the coordinates, e.g. in labels, are not converted
+        numbers = _COORDINATE_PATTERN.findall(line)[:no_of_coordinates]
+        # Decimal numbers, e.g. a value at the end of the line, are truncated like int(float(s))
+        return [int(s) if '.' not in s else int(float(s)) for s in numbers]
 
     def __write_to_plot_data_dict(self, key, value, update=False):
         """Function to write the symbol plot data to a dict
@@ -1433,56 +1994,48 @@ class Symbol:
         :type update: Bool, optional
         :return: void
         """
+        elements = self.plot_data.setdefault(key, [])
         if update:
             # print('*******************')
-            # print('Update: ' + str(self.plot_data[key]))
-            # print('Length: ' + str(len(self.plot_data[key])))
+            # print('Update: ' + str(elements))
             # print('New value: ' + str(value))
 
-            updated = False
-            # Loops trough existing window descriptions and overwrites them
-            for i in range(len(self.plot_data[key])):
-                if self.plot_data[key][i][0] == value[0]:
-                    self.plot_data[key][i] = value
-                    updated = True
-
-            if not updated:
-                self.plot_data[key].append(value)
-            # print('Updated: ' + str(self.plot_data[key]))
+            # Index of the existing descriptions, e.g. windows, by their type. Built on the first update of a key
+            index = self.__plot_data_index.get(key)
+            if index is None:
+                index = self.__plot_data_index[key] = {elem[0]: i for i, elem in enumerate(elements)}
+            if value[0] in index:
+                elements[index[value[0]]] = value
+            else:
+                index[value[0]] = len(elements)
+                elements.append(value)
+            # print('Updated: ' + str(elements))
         else:
-            try:
-                self.plot_data[key].append(value)
-            except KeyError:
-                self.plot_data[key] = [value]
+            elements.append(value)
+            # The index of the key doesn't know the new element anymore
+            self.__plot_data_index.pop(key, None)
 
     def __get_symbol_type(self):
         """ Function to determine the symbol type
 
         :param: None
-        :return: Void
+        :return: Symbol type or None if the symbol file has no type
+        :rtype: str
         """
+        # The symbol type is only declared once
         for line in self.raw_symbol:
-            if line.find('SymbolType') >= 0:
-                self.symbol_type = '-'.join(line.split(' ')[1:])
+            if line.startswith('SymbolType'):
+                return '-'.join(line.split(' ')[1:])
+        return None
 
     def __read_symbol(self):
         """Function to read the symbol file
 
         :param: None
-        :return: void
+        :return: Lines of the symbol file
+        :rtype: str list
         """
-        try:
-            fid = open(self.path_to_symbol, 'r')
-            if self.verbose:
-                print('Symbol: ' + self.symbol_model + ' encoding: default')
-            tmp_symbol = fid.readlines()
-        except:
-            fid = open(self.path_to_symbol, 'r', encoding='Latin9')
-            if (self.verbose):
-                print('Symbol encoding: Latin9')
-            tmp_symbol = fid.readlines()
-        # replace end of line
-        tmp_symbol = [w.replace('\n', '') for w in tmp_symbol]
-        # replace empty lines
-        tmp_symbol = [string for string in tmp_symbol if string != ""]
-        self.raw_symbol = tmp_symbol
+        encoding, tmp_symbol = _read_symbol_file(self.path_to_symbol, os.stat(self.path_to_symbol).st_mtime_ns)
+        if self.verbose:
+            print('Symbol: ' + self.symbol_model + ' encoding: ' + encoding)
+        return list(tmp_symbol)
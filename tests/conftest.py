@@ -0,0 +1,9 @@
+""" Test configuration: makes the modules in the repository root importable and plots without a display
+"""
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use('Agg')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,64 @@
+""" Tests of the nearest value search in DebugHelpers
+"""
+import numpy as np
+import pytest
+
+import DebugHelpers as debug
+
+
+def _brute_force(array, values):
+    """Index of the nearest element for each value, the first one on ties like argmin"""
+    array = np.asarray(array, dtype=np.float64)
+    return np.array([np.abs(array - value).argmin() for value in np.atleast_1d(values)])
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(1234)
+
+
+def test_find_nearest_sorted(rng):
+    # Repeated values and targets outside of the range
+    array = np.sort(rng.integers(0, 200, 1000)).astype(float)
+    values = np.concatenate((rng.uniform(-20, 220, 50), [0.5, 100.5, 199.5]))
+    np.testing.assert_array_equal(debug.find_nearest(array, values), _brute_force(array, values))
+
+
+def test_find_nearest_unsorted_few_values(rng):
+    array = rng.integers(0, 200, 1000).astype(float)
+    values = rng.uniform(-20, 220, 5)
+    np.testing.assert_array_equal(debug.find_nearest(array, values), _brute_force(array, values))
+
+
+def test_find_nearest_unsorted_many_values(rng):
+    # More values than _SORT_THRESHOLD, the array is sorted once
+    array = rng.integers(0, 200, 1000).astype(float)
+    values = np.concatenate((rng.uniform(-20, 220, 100), [0.5, 100.5, 199.5]))
+    np.testing.assert_array_equal(debug.find_nearest(array, values), _brute_force(array, values))
+
+
+def test_find_nearest_scalar(rng):
+    array = rng.normal(size=1000)
+    for value in (-10.0, 0.0, 0.25, 10.0):
+        index = debug.find_nearest(array, value)
+        assert isinstance(index, int)
+        assert index == _brute_force(array, value)[0]
+    # Lists are accepted as well
+    assert debug.find_nearest([3.0, 1.0, 2.0], 1.9) == 2
+
+
+def test_find_nearest_large_threaded(rng):
+    # Large unsorted arrays are scanned for several values in threads
+    array = rng.normal(size=debug._PARALLEL_MIN_SIZE)
+    values = rng.normal(size=4)
+    np.testing.assert_array_equal(debug.find_nearest(array, values), _brute_force(array, values))
+
+
+def test_nearest_finder(rng):
+    array = rng.integers(0, 200, 1000).astype(float)
+    finder = debug.NearestFinder(array)
+    values = np.concatenate((rng.uniform(-20, 220, 100), [0.5, 100.5, 199.5]))
+    np.testing.assert_array_equal(finder.find(values), _brute_force(array, values))
+    index = finder.find(42.4)
+    assert isinstance(index, int)
+    assert index == _brute_force(array, 42.4)[0]
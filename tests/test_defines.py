@@ -0,0 +1,40 @@
+""" Tests of the text tables in DefinesDefault
+"""
+import json
+import os
+
+import pytest
+
+import DefinesDefault
+
+# Text tables as nested {alignment: {rotation: value}} dicts, as they were defined before they were flattened
+with open(os.path.join(os.path.dirname(__file__), 'data', 'text_tables.json')) as fid:
+    NESTED_TEXT_TABLES = json.load(fid)
+
+
+def _flatten(table):
+    return {(alignment, rotation): value for alignment, row in table.items() for rotation, value in row.items()}
+
+
+@pytest.mark.parametrize('key', ['TEXT_VERTICAL_ALIGNMENTS', 'TEXT_HORIZONTAL_ALIGNMENTS'])
+def test_alignment_tables(key):
+    table = DefinesDefault.get_defines().get_define(key)
+    assert {position: DefinesDefault.ANCHOR_NAMES[anchor] for position, anchor in table.items()} == \
+        _flatten(NESTED_TEXT_TABLES[key])
+
+
+def test_rotation_angles():
+    expected = _flatten(NESTED_TEXT_TABLES['TEXT_ROTATION_ANGLES'])
+    assert dict(DefinesDefault.get_defines().get_define('TEXT_ROTATION_ANGLES')) == expected
+    for (alignment, rotation), angle in expected.items():
+        assert DefinesDefault.get_rotation_angle(alignment, rotation) == angle
+
+
+def test_text_style():
+    defines = DefinesDefault.Defines()
+    for (alignment, rotation), angle in _flatten(NESTED_TEXT_TABLES['TEXT_ROTATION_ANGLES']).items():
+        assert defines.get_text_style(alignment, rotation, 2) == (
+            NESTED_TEXT_TABLES['TEXT_HORIZONTAL_ALIGNMENTS'][alignment][rotation],
+            NESTED_TEXT_TABLES['TEXT_VERTICAL_ALIGNMENTS'][alignment][rotation],
+            angle,
+            DefinesDefault.DEFAULT_FONT_SIZE * DefinesDefault.LTSPICE_FONTSIZES[2])
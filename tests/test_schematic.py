@@ -0,0 +1,37 @@
+""" Tests of the Schematic class
+"""
+import matplotlib.pyplot as plt
+
+import PyLTSpice_macOS as LTC
+
+
+def _wire_schematic(tmp_path):
+    """Schematic with two wires and no symbols"""
+    return LTC.Schematic(['Version 4\n', 'SHEET 1 880 680\n', 'WIRE 0 0 96 0\n', 'WIRE 96 0 96 96\n'],
+                         path_to_symbol_library=str(tmp_path))
+
+
+def test_dynamic_overlay_background_after_zoom(tmp_path):
+    """The stored background is drawn again after the view of the schematic changed"""
+    schematic = _wire_schematic(tmp_path)
+    schematic.plot_schematic()
+    fig = plt.gcf()
+    ax = fig.axes[0]
+    try:
+        marker, = ax.plot([48], [0], 'o')
+        schematic.set_dynamic_overlay([marker])
+        schematic.update_dynamic_overlay()
+        background = schematic._Schematic__background
+        assert background is not None
+        # Without a full redraw, the stored background is reused
+        schematic.update_dynamic_overlay()
+        assert schematic._Schematic__background is background
+        # Zooming draws the figure again, the background of the old view must not be restored
+        ax.set_xlim(0, 48)
+        fig.canvas.draw()
+        assert schematic._Schematic__background is None
+        schematic.update_dynamic_overlay()
+        assert schematic._Schematic__background is not None
+        assert schematic._Schematic__background is not background
+    finally:
+        plt.close(fig)
@@ -0,0 +1,31 @@
+""" Tests of the Symbol class
+"""
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+import PyLTSpice_macOS as LTC
+
+
+def _write_symbol(path, lines):
+    """Writes a symbol file into a temporary symbol library"""
+    path.write_text('Version 4\nSymbolType CELL\n' + '\n'.join(lines) + '\n')
+
+
+def test_plot_symbol_dash_dot_dot_line(tmp_path):
+    """LTSpice line style 4 is the format string '-..', which a LineCollection does not take"""
+    _write_symbol(tmp_path / 'dashdotdot.asy', ['LINE Normal 16 88 16 96 4', 'LINE Normal 0 0 16 16'])
+    symbol = LTC.Symbol('dashdotdot', 'X1', 'value', [0, 0], 'R0', path_to_symbol_library=str(tmp_path))
+    fig, ax = plt.subplots()
+    try:
+        symbol.plot_symbol()
+        # The dash-dot-dot line is drawn like before, as a dash-dot line with point markers
+        assert len(ax.lines) == 1
+        assert ax.lines[0].get_linestyle() == '-.'
+        assert ax.lines[0].get_marker() == '.'
+        assert list(ax.lines[0].get_xdata()) == [16, 16]
+        # The solid line is still drawn in the collection
+        collections = [collection for collection in ax.collections if isinstance(collection, LineCollection)]
+        assert len(collections) == 1
+        assert len(collections[0].get_segments()) == 1
+    finally:
+        plt.close(fig)